@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of per call overhead of statistics, triggers, and timers.
+
+Each measurement compares the dispatch as it was implemented before, i.e.,
+method lookup by ``eval`` and log messages formatted regardless of logging
+level, with the current bound method dispatch and guarded logging.
+Logging is not enabled, so that only the overhead is measured.
+
+Run from the root folder of the package as::
+
+    python -m benchmarks.dispatch
+
+"""
+import logging
+import timeit
+
+from gbj_pythonlib_sw import statfilter
+from gbj_pythonlib_sw import timer
+from gbj_pythonlib_sw import trigger
+
+
+NUMBER = 100000
+"""int: Number of calls per measurement."""
+
+
+def callback(*args, **kwargs):
+    """Do nothing as a callback."""
+
+
+def bench_statfilter():
+    """Return times per call of running statistics in microseconds."""
+    flt = statfilter.Running(5, 'MAX')
+
+    def before():
+        func = eval('flt.result_' + flt.stat_type.lower())
+        return func(1.0)
+
+    def after():
+        return flt.result(1.0)
+
+    return measure(before), measure(after)
+
+
+def bench_trigger():
+    """Return times per call of an upper trigger in microseconds."""
+    trg = trigger.Trigger(0.0, callback, mode='UPPER')
+    logger = logging.getLogger('benchmark')
+
+    def before():
+        func = eval('trg._run_' + trg.mode.lower())
+        msg = \
+            f"{trg.mode} trigger's " \
+            f'callback {callback.__name__} ' \
+            f'for threshold {str(trg.threshold)} ' \
+            f'at value {str(1.0)}'
+        logger.debug(msg)
+        return func(1.0)
+
+    def after():
+        return trg.run(1.0)
+
+    result = measure(before), measure(after)
+    trigger.unregister(trg.name)
+    return result
+
+
+def bench_timer():
+    """Return times per tick of a timer with one prescaler in microseconds."""
+    tmr = timer.Timer(1.0, callback)
+    tmr.prescaler(2, callback)
+    # Prevent starting timer threads at running callbacks
+    tmr._stopping = True
+    logger = logging.getLogger('benchmark')
+
+    def before():
+        logger.debug('Main callback %s of %s launched',
+                     callback.__name__, str(tmr))
+        logger.debug('Prescaler %d callback %s of %s launched',
+                     2, callback.__name__, str(tmr))
+        tmr._run_callback()
+
+    def after():
+        tmr._run_callback()
+
+    result = measure(before), measure(after)
+    timer.unregister(tmr.name)
+    return result
+
+
+def measure(func):
+    """Return time per call of a function in microseconds."""
+    return min(timeit.repeat(func, number=NUMBER, repeat=3)) / NUMBER * 1e6
+
+
+def main():
+    """Run benchmark for all modules and print the results."""
+    print(f'{"module":>12} {"before":>10} {"after":>10} {"speedup":>8}')
+    for name, bench in (
+        ('statfilter', bench_statfilter),
+        ('trigger', bench_trigger),
+        ('timer', bench_timer),
+    ):
+        t_before, t_after = bench()
+        print(f'{name:>12} {t_before:>8.2f}us {t_after:>8.2f}us '
+              f'{t_before / t_after:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
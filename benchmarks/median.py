@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of the sliding window median of the running statistics.
+
+The incrementally maintained median of ``statfilter.Running`` is compared
+with the calculation of ``statistics.median`` over a copy of the window
+at every sample.
+
+Run from the root folder of the package as::
+
+    python -m benchmarks.median
+
+"""
+import collections
+import random
+import statistics
+import time
+
+from gbj_pythonlib_sw import statfilter
+
+
+SAMPLES = 20000
+"""int: Number of measured samples after filling the window."""
+
+WINDOWS = [1001, 10001]
+"""list of int: Measured window lengths."""
+
+
+def bench_running(window, values):
+    """Return time per sample of the running median in microseconds."""
+    flt = statfilter.Running(window, 'MED')
+    for value in values[:window]:
+        flt.result(value)
+    start = time.perf_counter()
+    for value in values[window:]:
+        flt.result(value)
+    return (time.perf_counter() - start) / SAMPLES * 1e6
+
+
+def bench_statistics(window, values):
+    """Return time per sample of the median of a window copy in microseconds."""
+    buffer = collections.deque(values[:window], maxlen=window)
+    start = time.perf_counter()
+    for value in values[window:]:
+        buffer.append(value)
+        statistics.median(list(buffer))
+    return (time.perf_counter() - start) / SAMPLES * 1e6
+
+
+def main():
+    """Run benchmark for all window lengths and print the results."""
+    random.seed(0)
+    print(f'{"window":>8} {"Running":>12} {"statistics":>12} {"speedup":>8}')
+    for window in WINDOWS:
+        values = [random.gauss(0, 1) for _ in range(window + SAMPLES)]
+        t_run = bench_running(window, values)
+        t_stat = bench_statistics(window, values)
+        print(f'{window:>8} {t_run:>10.2f}us {t_stat:>10.2f}us '
+              f'{t_stat / t_run:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of memory consumed by instances of filters, triggers, and timers.
+
+Each measurement creates a number of instances, keeps them alive, and reports
+memory allocated per instance traced by ``tracemalloc``. The package of the
+current tree is compared with the package of a git revision, e.g., the one
+before instances got ``__slots__`` and the module logger, i.e., with
+the per-instance ``__dict__``, logger reference, and list buffers.
+Each package is measured in a separate process.
+
+Run from the root folder of the package as::
+
+    python -m benchmarks.memory <revision>
+
+"""
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import tracemalloc
+
+
+NUMBER = 20000
+"""int: Number of instances per measurement."""
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+"""str: Root folder of the repository."""
+
+
+def callback(*args, **kwargs):
+    """Do nothing as a callback."""
+
+
+def factories():
+    """Return named functions creating instances of measured classes."""
+    from gbj_pythonlib_sw import statfilter
+    from gbj_pythonlib_sw import timer
+    from gbj_pythonlib_sw import trigger
+
+    def running():
+        flt = statfilter.Running(5)
+        for value in range(5):
+            flt.result(float(value))
+        return flt
+
+    def exponential():
+        flt = statfilter.Exponential(0.5)
+        flt.result(1.0)
+        return flt
+
+    return {
+        'ValueFilter': lambda: statfilter.ValueFilter(100.0, 0.0),
+        'Exponential': exponential,
+        'Running': running,
+        'Trigger': lambda: trigger.Trigger(1.0, callback),
+        'Timer': lambda: timer.Timer(1.0, callback),
+    }
+
+
+def measure(factory):
+    """Return number of bytes allocated per instance created by factory."""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    instances = [factory() for _ in range(NUMBER)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del instances
+    return used / NUMBER
+
+
+def worker():
+    """Print measurements of the package found on the import path."""
+    from gbj_pythonlib_sw import timer
+    from gbj_pythonlib_sw import trigger
+    results = {}
+    for name, factory in factories().items():
+        results[name] = measure(factory)
+        # Registered instances would be kept alive for next measurements
+        timer.timers.clear()
+        trigger.triggers.clear()
+    print(json.dumps(results))
+
+
+def run(path):
+    """Return measurements of the package in the folder in a new process."""
+    env = dict(os.environ, PYTHONPATH=path)
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker'],
+        cwd=path, env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    """Measure both packages and print the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('revision', nargs='?',
+                        help='git revision measured as before')
+    parser.add_argument('--worker', action='store_true',
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        worker()
+        return
+    if args.revision is None:
+        parser.error('the following arguments are required: revision')
+    with tempfile.TemporaryDirectory() as folder:
+        archive = os.path.join(folder, 'package.tar')
+        subprocess.run(
+            ['git', 'archive', '-o', archive, args.revision,
+             'gbj_pythonlib_sw'],
+            cwd=ROOT, check=True,
+        )
+        with tarfile.open(archive) as tar:
+            tar.extractall(folder)
+        before = run(folder)
+    after = run(ROOT)
+    print(f'Bytes per instance of {NUMBER} instances')
+    print(f'{"Class":<12} {"before":>10} {"after":>10} {"saved":>7}')
+    for name in after:
+        saved = 1 - after[name] / before[name]
+        print(f'{name:<12} {before[name]:10.0f} {after[name]:10.0f}'
+              f' {saved:7.0%}')
+
+
+if __name__ == '__main__':
+    main()
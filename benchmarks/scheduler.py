@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of CPU use and thread churn of timer scheduler backends.
+
+For each backend and number of timers, periodic timers with an empty
+callback run for a while. The benchmark reports CPU time of the process
+relative to the elapsed time, number of threads started per second, and
+number of callbacks run per second.
+
+Run from the root folder of the package as::
+
+    python -m benchmarks.scheduler
+
+"""
+import threading
+import time
+
+from gbj_pythonlib_sw import timer
+
+
+PERIOD = 0.1
+"""float: Period of timers in seconds."""
+
+DURATION = 3.0
+"""float: Running time of timers per measurement in seconds."""
+
+COUNTS = (10, 100, 1000)
+"""tuple of int: Numbers of concurrently running timers."""
+
+BACKENDS = ('thread', 'heap')
+"""tuple of str: Measured scheduler backends."""
+
+
+class Counter(object):
+    """Counting callbacks and threads started."""
+
+    def __init__(self):
+        """Create the class instance - constructor."""
+        self.calls = 0
+        self.threads = 0
+        self._lock = threading.Lock()
+        self._start = threading.Thread.start
+        counter = self
+
+        def start(thread):
+            counter.threads += 1
+            counter._start(thread)
+
+        threading.Thread.start = start
+
+    def restore(self):
+        """Restore original method of starting threads."""
+        threading.Thread.start = self._start
+
+    def callback(self, *args, **kwargs):
+        """Count calls as a timer callback."""
+        with self._lock:
+            self.calls += 1
+
+
+def bench(backend, count):
+    """Return CPU share, threads and calls per second of running timers."""
+    timer.timers.clear()
+    timer.set_backend(backend)
+    counter = Counter()
+    for i in range(count):
+        timer.Timer(PERIOD, counter.callback, name=f'Bench{i}')
+    cpu = time.process_time()
+    wall = time.perf_counter()
+    timer.start_all()
+    time.sleep(DURATION)
+    timer.stop_all()
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+    counter.restore()
+    time.sleep(2 * PERIOD)
+    timer.timers.clear()
+    return cpu / wall, counter.threads / wall, counter.calls / wall
+
+
+def main():
+    """Run all measurements and print results."""
+    print(f'{"backend":>8} {"timers":>7} {"cpu":>7} '
+          f'{"threads/s":>10} {"calls/s":>9}')
+    for backend in BACKENDS:
+        for count in COUNTS:
+            cpu, threads, calls = bench(backend, count)
+            print(f'{backend:>8} {count:7d} {cpu:7.1%} '
+                  f'{threads:10.1f} {calls:9.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of starting and cancelling many one-shot timers.
+
+For each backend, one-shot timers with a long timeout are created,
+registered, started, and cancelled by unregistering them, as timeouts of
+device sessions are. The benchmark reports the rate of complete timer life
+cycles and the rate of bare planning and cancelling of scheduler calls.
+
+Run from the root folder of the package as::
+
+    python -m benchmarks.wheel
+
+"""
+import time
+
+from gbj_pythonlib_sw import timer
+
+
+NUMBER = 100000
+"""int: Number of one-shot timers per measurement."""
+
+TIMEOUT = 60.0
+"""float: Timeout of timers in seconds, so that none of them expires."""
+
+BACKENDS = ('heap', 'wheel')
+"""tuple of str: Measured scheduler backends."""
+
+
+def callback(*args, **kwargs):
+    """Do nothing as a callback."""
+
+
+def bench_timers(backend):
+    """Return timers created, started, and cancelled per second."""
+    timer.timers.clear()
+    scheduler = timer.BACKENDS[backend]()
+    start = time.perf_counter()
+    for i in range(NUMBER):
+        timer.Timer(TIMEOUT, callback, count=1, name=f'Session{i}',
+                    backend=scheduler).start()
+    for i in range(NUMBER):
+        timer.unregister(f'Session{i}')
+    return NUMBER / (time.perf_counter() - start)
+
+
+def bench_calls(backend):
+    """Return scheduler calls planned and cancelled per second."""
+    scheduler = timer.BACKENDS[backend]()
+    deadline = time.monotonic() + TIMEOUT
+    start = time.perf_counter()
+    handles = [scheduler.call_at(deadline + i * 1e-5, callback)
+               for i in range(NUMBER)]
+    for handle in handles:
+        handle.cancel()
+    return NUMBER / (time.perf_counter() - start)
+
+
+def main():
+    """Run all measurements and print results."""
+    print(f'{NUMBER} one-shot timers')
+    print(f'{"backend":>8} {"timers/s":>10} {"calls/s":>10}')
+    for backend in BACKENDS:
+        timers = bench_timers(backend)
+        calls = bench_calls(backend)
+        print(f'{backend:>8} {timers:10.0f} {calls:10.0f}')
+
+
+if __name__ == '__main__':
+    main()
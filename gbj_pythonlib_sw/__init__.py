@@ -3,6 +3,7 @@
 
 - config
 - mqtt
+- pipeline
 - statfilter
 - timer
 - trigger
@@ -13,6 +14,7 @@
 from . import config as config
 from . import mqtt as mqtt
 from . import statfilter as statfilter
+from . import pipeline as pipeline
 from . import timer as timer
 from . import trigger as trigger
 from . import utils as utils
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+"""Module for chaining value filters, smoothers, and triggers."""
+__version__ = '0.1.0'
+__status__ = 'Beta'
+__author__ = 'Libor Gabaj'
+__copyright__ = 'Copyright 2018-2019, ' + __author__
+__credits__ = []
+__license__ = 'MIT'
+__maintainer__ = __author__
+__email__ = 'libor.gabaj@gmail.com'
+
+
+import logging
+import math
+import time
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import statfilter
+from . import trigger
+
+
+###############################################################################
+# Variables
+###############################################################################
+_logger = logging.getLogger(' '.join([__name__, __version__]))
+"""logging.Logger: Logger shared by all instances of the module's classes."""
+
+
+###############################################################################
+# Classes
+###############################################################################
+class Sink(object):
+    """Pipeline stage consuming values without changing them.
+
+    Arguments
+    ---------
+    func : function
+        Function called with each value passing the stage, e.g., the function
+        `trigger.run_all`. Its return value is ignored.
+
+    """
+
+    __slots__ = ('func',)
+
+    def __init__(self, func):
+        """Create the class instance - constructor."""
+        self.func = func
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        return f'Sink({getattr(self.func, "__name__", self.func)})'
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        return f'{self.__class__.__name__}(func={repr(self.func)})'
+
+
+class Pipeline(object):
+    """Chaining processing stages into one callable object.
+
+    Arguments
+    ---------
+    stages : tuple
+        Processing stages in order of processing a value. Each of them is one
+        of following objects
+        - ``statfilter.ValueFilter``: Value is filtered by its method
+          `filter` or `filter_batch`.
+        - ``statfilter.StatFilter``: Value is smoothed by its method
+          `result` or `result_batch`, if the smoother has got it, otherwise
+          by the method `result` for each value. The ``statfilter.Decimator``
+          is not supported, because it returns interval summaries instead of
+          values.
+        - ``trigger.Trigger``: Trigger is run with the value that passes the
+          stage unchanged.
+        - ``Sink``: Wrapped function is called with the value that passes the
+          stage unchanged.
+        - function: Value is replaced with the return value of the function.
+
+    Keyword Arguments
+    -----------------
+    timing : bool
+        Flag about measuring processing time of each stage.
+
+    Notes
+    -----
+    - Bound methods of stages are looked up once at creating the pipeline,
+      so that a value goes through a plain chain of calls.
+    - If a stage returns None, the processing of the value stops and
+      the pipeline returns None.
+
+    """
+
+    __slots__ = (
+        '_stages', '_names', '_calls', '_times', '_steps', '_timing',
+        '_process',
+    )
+
+    def __init__(self, *stages, timing=False):
+        """Create the class instance - constructor."""
+        if not stages:
+            raise ValueError('No pipeline stages')
+        self._stages = stages
+        self._names = tuple(self._name(stage) for stage in stages)
+        self._calls = [0] * len(stages)
+        self._times = [0] * len(stages)
+        self._steps = tuple(self._compile(stage) for stage in stages)
+        self.timing = timing
+        _logger.debug(
+            'Instance of %s created: %s',
+            self.__class__.__name__, str(self)
+            )
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        msg = \
+            f'Pipeline(' \
+            f'{" > ".join(self._names)})'
+        return msg
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        stages = ', '.join(repr(stage) for stage in self._stages)
+        msg = \
+            f'{self.__class__.__name__}(' \
+            f'{stages}, ' \
+            f'timing={repr(self.timing)})'
+        return msg
+
+    @staticmethod
+    def _name(stage):
+        """Return name of a stage."""
+        if isinstance(stage, trigger.Trigger):
+            return stage.name
+        if isinstance(stage, (statfilter.ValueFilter, statfilter.StatFilter,
+                              Sink)):
+            return str(stage)
+        return getattr(stage, '__name__', str(stage))
+
+    @staticmethod
+    def _compile(stage):
+        """Return stream and batch processing functions and sink flag."""
+        if isinstance(stage, statfilter.ValueFilter):
+            return stage.filter, stage.filter_batch, False
+        if isinstance(stage, statfilter.Decimator):
+            raise TypeError(f'Unsupported pipeline stage {repr(stage)}')
+        if isinstance(stage, statfilter.StatFilter):
+            return stage.result, getattr(stage, 'result_batch', None), False
+        if isinstance(stage, trigger.Trigger):
+            return stage.run, None, True
+        if isinstance(stage, Sink):
+            return stage.func, None, True
+        if callable(stage):
+            return stage, None, False
+        raise TypeError(f'Unsupported pipeline stage {repr(stage)}')
+
+    @property
+    def stages(self):
+        """Tuple of processing stages."""
+        return self._stages
+
+    @property
+    def timing(self):
+        """Flag about measuring processing time of stages."""
+        return self._timing
+
+    @timing.setter
+    def timing(self, timing):
+        """Switch measuring of processing time and bind processing method."""
+        self._timing = bool(timing)
+        # Plain function, since a bound method would reference the instance
+        self._process = \
+            type(self)._run_timed if self._timing else type(self)._run
+
+    def timings(self):
+        """Return processing statistics of stages.
+
+        Returns
+        -------
+        list of tuple
+            Name of a stage, number of its calls, and total processing time
+            in seconds for each stage in order of processing.
+
+        """
+        return [
+            (name, calls, nanoseconds * 1e-9)
+            for name, calls, nanoseconds
+            in zip(self._names, self._calls, self._times)
+        ]
+
+    def reset_timings(self):
+        """Reset processing statistics of stages."""
+        for i in range(len(self._stages)):
+            self._calls[i] = 0
+            self._times[i] = 0
+
+    def _run(self, value):
+        """Process value by all stages."""
+        for func, _, sink in self._steps:
+            if sink:
+                func(value)
+                continue
+            value = func(value)
+            if value is None:
+                return
+        return value
+
+    def _run_timed(self, value):
+        """Process value by all stages measuring their processing time."""
+        clock = time.perf_counter_ns
+        for i, (func, _, sink) in enumerate(self._steps):
+            start = clock()
+            if sink:
+                func(value)
+            else:
+                value = func(value)
+            self._times[i] += clock() - start
+            self._calls[i] += 1
+            if value is None:
+                return
+        return value
+
+    def __call__(self, value):
+        """Process value by all stages.
+
+        Arguments
+        ---------
+        value : float
+            Value to be processed.
+
+        Returns
+        -------
+        float | None
+            Value returned by the last stage that does not pass its input,
+            or None if some stage has stopped the processing.
+
+        """
+        return self._process(self, value)
+
+    def stream(self):
+        """Create coroutine processing values sent to it.
+
+        Returns
+        -------
+        generator
+            Started generator, which processes each value sent to it by its
+            method `send` and returns the result of the pipeline.
+
+        """
+        def _coroutine():
+            result = None
+            while True:
+                value = yield result
+                result = self._process(self, value)
+
+        coroutine = _coroutine()
+        next(coroutine)
+        return coroutine
+
+    def run_batch(self, values):
+        """Process an array of values by all stages.
+
+        Arguments
+        ---------
+        values : array_like
+            One-dimensional array of values to be processed in order of their
+            arrival. Missing values are marked by ``NaN``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of results as the method `__call__` would return them for
+            input values one by one, with ``NaN`` instead of None.
+
+        Notes
+        -----
+        - Filters and smoothers process the entire array at once.
+        - Triggers, sinks, and functions are called for each valid value.
+        - Missing or rejected values stay missing in subsequent stages, so
+          that smoothers do not repeat their previous results at them.
+
+        """
+        statfilter._check_numpy()
+        values = np.array(values, dtype=float).ravel()
+        clock = time.perf_counter_ns
+        for i, (func, func_batch, sink) in enumerate(self._steps):
+            start = clock()
+            valid = ~np.isnan(values)
+            if func_batch is not None:
+                values = func_batch(values)
+                # Stopped values are not forward filled by smoothers
+                values[~valid] = math.nan
+            else:
+                items = values[valid].tolist()
+                if sink:
+                    for value in items:
+                        func(value)
+                else:
+                    items = [func(value) for value in items]
+                    values[valid] = [
+                        math.nan if value is None else value
+                        for value in items
+                    ]
+            if self._timing:
+                self._times[i] += clock() - start
+                self._calls[i] += 1
+        return values
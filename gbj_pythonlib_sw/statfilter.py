@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """Module for statistical filtering and smoothing."""
-__version__ = '0.6.0'
+__version__ = '0.7.0'
 __status__ = 'Beta'
 __author__ = 'Libor Gabaj'
 __copyright__ = 'Copyright 2018-2019, ' + __author__
@@ -12,6 +12,415 @@ __email__ = 'libor.gabaj@gmail.com'
 
 import logging
 import abc
+import math
+import time
+import bisect
+import collections
+import concurrent.futures
+import csv
+import inspect
+import itertools
+import struct
+import sys
+import warnings
+from array import array
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+###############################################################################
+# Variables
+###############################################################################
+_logger = logging.getLogger(' '.join([__name__, __version__]))
+"""logging.Logger: Logger shared by all instances of the module's classes."""
+
+_IIR_CHUNK_LOG = 300.0
+"""float: Natural logarithm of the maximal inverse decay within a chunk."""
+
+_BATCH_CHUNK = 1 << 20
+"""int: Maximal number of window items reduced at once in batch processing."""
+
+SNAPSHOT_VERSION = 1
+"""int: Version of binary format of filter snapshots."""
+
+_SNAPSHOT_HEADER = struct.Struct('<4sB')
+"""struct.Struct: Snapshot header with filter type tag and format version."""
+
+_SNAPSHOT_FILE = struct.Struct('<4sBI')
+"""struct.Struct: File header with magic, format version, and records count."""
+
+_SNAPSHOT_RECORD = struct.Struct('<HI')
+"""struct.Struct: File record header with lengths of name and snapshot."""
+
+REPLAY_CHUNK_LEN = 1 << 16
+"""int: Default number of log lines read and processed at once at replay."""
+
+
+###############################################################################
+# Functions
+###############################################################################
+def _check_numpy():
+    """Raise exception if the numpy package for batch processing is missing."""
+    if np is None:
+        raise ImportError('Batch processing requires the numpy package')
+
+
+def _iir_batch(start, values, decay):
+    """Calculate first order recursive filter over an array.
+
+    Arguments
+    ---------
+    start : float
+        Filtered value preceding the first input value.
+    values : numpy.ndarray
+        Input values without missing ones.
+    decay : float | numpy.ndarray
+        Weight of the previous filtered value for all or each input value.
+
+    Returns
+    -------
+    numpy.ndarray
+        Filtered values ``y[k] = decay[k] * y[k-1] + (1 - decay[k]) * x[k]``.
+
+    Notes
+    -----
+    - The recursion is evaluated in closed form by cumulative products of
+      decays in vectorized chunks. A chunk ends before the cumulative product
+      would underflow, so that its inverse stays in floating point range.
+
+    """
+    decay = np.broadcast_to(np.asarray(decay, dtype=float), values.shape)
+    # Limit decay of a single step, so that every chunk has a value at least
+    log_decay = np.log(np.maximum(decay, math.exp(-_IIR_CHUNK_LOG)))
+    cum_decay = np.cumsum(log_decay)
+    neg_decay = -cum_decay
+    weighted = (1.0 - decay) * values
+    result = np.empty_like(values)
+    base = 0.0
+    i = 0
+    while i < values.size:
+        j = int(np.searchsorted(neg_decay, _IIR_CHUNK_LOG - base,
+                                side='right'))
+        scale = np.exp(cum_decay[i:j] - base)
+        result[i:j] = scale * (start + np.cumsum(weighted[i:j] / scale))
+        start = result[j - 1]
+        base = cum_decay[j - 1]
+        i = j
+    return result
+
+
+def _forward_fill(mask, values, start=math.nan):
+    """Spread values to positions of missing ones.
+
+    Arguments
+    ---------
+    mask : numpy.ndarray
+        Boolean flags of input positions with valid values.
+    values : numpy.ndarray
+        Values for valid positions only.
+    start : float
+        Value used for positions before the first valid one.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of mask length with the recent valid value at every position.
+
+    """
+    values = np.concatenate(([start], values))
+    return values[np.cumsum(mask)]
+
+
+def _kth_deviation(values, center, k):
+    """Return k-th smallest absolute deviation of sorted values from center.
+
+    Arguments
+    ---------
+    values : array
+        Values sorted in ascending order.
+    center : float
+        Value, which deviations are related to.
+    k : int
+        Zero based order of the deviation.
+
+    Notes
+    -----
+    - Deviations of values below and above the center form two ascending
+      sequences, so that the k-th smallest deviation is found by binary
+      search over both of them in O(log n) without calculating deviations
+      of all values.
+
+    """
+    split = bisect.bisect_left(values, center)
+    count_low = split
+    count_high = len(values) - split
+
+    def low(i):
+        return center - values[split - 1 - i] if i < count_low else math.inf
+
+    def high(i):
+        return values[split + i] - center if i >= 0 else -math.inf
+
+    # Find number of deviations taken from values below center
+    lo = max(0, k + 1 - count_high)
+    hi = min(k + 1, count_low)
+    while lo < hi:
+        i = (lo + hi) // 2
+        if low(i) < high(k - i):
+            lo = i + 1
+        else:
+            hi = i
+    taken_low = center - values[split - lo] if lo else -math.inf
+    return max(taken_low, high(k - lo))
+
+
+def _positive(value, default):
+    """Return absolute float of the value or default one if it is not a number.
+
+    Arguments
+    ---------
+    value : float
+        Input value to be sanitized.
+    default : float
+        Value used for input value not convertible to a nonzero float.
+
+    """
+    try:
+        return abs(float(value)) or default
+    except (TypeError, ValueError):
+        return default
+
+
+def savgol_taps(window_len, order, deriv=0, pos=None):
+    """Calculate Savitzky-Golay coefficients of a convolution smoother.
+
+    Arguments
+    ---------
+    window_len : int
+        Number of samples fitted by a polynomial.
+    order : int
+        Order of the fitted polynomial lower than window length.
+    deriv : int
+        Order of the derivative of the fitted polynomial, zero for smoothing.
+    pos : int
+        Index of the sample in the window, in which the polynomial is
+        evaluated. The default is the middle of the window, the last index
+        evaluates at the newest sample without any lag.
+
+    Returns
+    -------
+    tuple
+        Coefficients for window samples ordered from the oldest one.
+
+    Notes
+    -----
+    - Coefficients are the row of the least squares solution of polynomial
+      fit, so that they are calculated without any external package.
+    - The derivative is per sample, i.e., for unit sampling period.
+
+    """
+    window_len = int(window_len)
+    order = int(order)
+    deriv = int(deriv)
+    if pos is None:
+        pos = window_len // 2
+    if not 0 <= order < window_len:
+        raise ValueError(f'Order {order} out of window length {window_len}')
+    if not 0 <= deriv <= order:
+        raise ValueError(f'Derivative {deriv} out of order {order}')
+    if not 0 <= pos < window_len:
+        raise ValueError(f'Position {pos} out of window length {window_len}')
+    size = order + 1
+    points = [i - pos for i in range(window_len)]
+    # Normal equations of the fit with right side for the derivative
+    matrix = [
+        [math.fsum(t ** (row + col) for t in points) for col in range(size)]
+        + [float(math.factorial(deriv)) if row == deriv else 0.0]
+        for row in range(size)
+    ]
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda row: abs(matrix[row][col]))
+        matrix[col], matrix[pivot] = matrix[pivot], matrix[col]
+        for row in range(size):
+            if row != col:
+                ratio = matrix[row][col] / matrix[col][col]
+                matrix[row] = [
+                    a - ratio * b for a, b in zip(matrix[row], matrix[col])
+                ]
+    solution = [matrix[row][size] / matrix[row][row] for row in range(size)]
+    return tuple(
+        math.fsum(c * t ** k for k, c in enumerate(solution))
+        for t in points
+    )
+
+
+def _pack_array(values):
+    """Return bytes of float array in little endian byte order."""
+    values = array('d', values)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack_array(data, offset, count):
+    """Return float array from bytes in little endian byte order.
+
+    Arguments
+    ---------
+    data : bytes
+        Buffer with packed float array.
+    offset : int
+        Position of the array in the buffer.
+    count : int
+        Number of floats in the array.
+
+    Returns
+    -------
+    tuple
+        Float array and position in the buffer after it.
+
+    """
+    end = offset + count * 8
+    if end > len(data):
+        raise ValueError('Truncated snapshot')
+    values = array('d')
+    values.frombytes(bytes(data[offset:end]))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values, end
+
+
+def save_snapshots(filters, file):
+    """Save snapshots of multiple statistical filters to a binary file.
+
+    Arguments
+    ---------
+    filters : dict
+        Statistical filters under their unique names.
+    file : str | file object
+        Path to the file or binary file object opened for writing.
+
+    Notes
+    -----
+    - Filters not supporting snapshots are skipped.
+
+    """
+    records = []
+    for name, flt in filters.items():
+        try:
+            data = flt.snapshot()
+        except (AttributeError, NotImplementedError):
+            continue
+        name = str(name).encode('utf-8')
+        records.append(_SNAPSHOT_RECORD.pack(len(name), len(data)))
+        records.append(name)
+        records.append(data)
+    header = _SNAPSHOT_FILE.pack(b'GBSF', SNAPSHOT_VERSION, len(records) // 3)
+    if isinstance(file, str):
+        with open(file, 'wb') as fp:
+            fp.write(header)
+            fp.writelines(records)
+    else:
+        file.write(header)
+        file.writelines(records)
+
+
+def load_snapshots(filters, file):
+    """Restore multiple statistical filters from a binary file of snapshots.
+
+    Arguments
+    ---------
+    filters : dict
+        Statistical filters under their unique names, which are restored
+        from the snapshots saved under the same names.
+    file : str | file object
+        Path to the file or binary file object opened for reading.
+
+    Returns
+    -------
+    list of str
+        Names of restored filters.
+
+    Notes
+    -----
+    - Snapshots without corresponding filter or of different type are
+      ignored.
+
+    """
+    if isinstance(file, str):
+        with open(file, 'rb') as fp:
+            data = fp.read()
+    else:
+        data = file.read()
+    data = memoryview(data)
+    magic, version, count = _SNAPSHOT_FILE.unpack_from(data)
+    if magic != b'GBSF' or version != SNAPSHOT_VERSION:
+        raise ValueError('Unknown format of snapshots file')
+    offset = _SNAPSHOT_FILE.size
+    restored = []
+    for _ in range(count):
+        name_len, data_len = _SNAPSHOT_RECORD.unpack_from(data, offset)
+        offset += _SNAPSHOT_RECORD.size
+        name = bytes(data[offset:offset + name_len]).decode('utf-8')
+        offset += name_len
+        snapshot = data[offset:offset + data_len]
+        offset += data_len
+        flt = filters.get(name)
+        if flt is None:
+            continue
+        try:
+            flt.restore(snapshot)
+        except (AttributeError, NotImplementedError, ValueError,
+                struct.error):
+            _logger.warning('Snapshot %s not restored', name)
+            continue
+        restored.append(name)
+    return restored
+
+
+def _window_stat(stat_type, windows, partial):
+    """Calculate statistic for every row of a two-dimensional array.
+
+    Arguments
+    ---------
+    stat_type : str
+        Abbreviation of calculated statistic type.
+    windows : numpy.ndarray
+        Rows of sliding windows.
+    partial : bool
+        Flag about rows with missing values, which should be ignored.
+
+    Returns
+    -------
+    numpy.ndarray
+        Statistic for every row.
+
+    """
+    if partial:
+        funcs = {
+            'AVG': np.nanmean, 'MED': np.nanmedian,
+            'MAX': np.nanmax, 'MIN': np.nanmin,
+            'VAR': np.nanvar, 'STD': np.nanstd,
+        }
+    else:
+        funcs = {
+            'AVG': np.mean, 'MED': np.median,
+            'MAX': np.max, 'MIN': np.min,
+            'VAR': np.var, 'STD': np.std,
+        }
+    func = funcs[stat_type]
+    if stat_type in ('VAR', 'STD'):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            stats = func(windows, axis=1, ddof=1)
+        # Variance of a single value is zero
+        counts = np.count_nonzero(~np.isnan(windows), axis=1)
+        stats[counts < 2] = 0.0
+        return stats
+    return func(windows, axis=1)
+
 
 
 ###############################################################################
@@ -26,19 +435,43 @@ class ValueFilter(object):
         Maximal acceptable value.
     value_min : float
         Minimal acceptable value.
+    log_interval : float
+        Minimal time interval in seconds between warnings about rejected
+        values.
+
+    Notes
+    -----
+    - Accepted and rejected values are counted in the attributes
+      ``accepted``, ``rejected_high``, and ``rejected_low``, and the most
+      recent rejected value is kept in the attribute ``last_rejected``.
+    - Rejected values are not logged one by one, but summarized in a warning
+      at most once per logging interval.
 
     """
 
+    __slots__ = (
+        '_value_max', '_value_min', 'log_interval', 'accepted',
+        'rejected_high', 'rejected_low', 'last_rejected', '_report_time',
+        '_reported',
+    )
+
+    LOG_INTERVAL_DEF = 60.0
+    """float: Default interval of warnings about rejected values in seconds."""
+
     def __init__(self,
                  value_max=None,
                  value_min=None,
+                 log_interval=LOG_INTERVAL_DEF,
                  ):
         """Create the class instance - constructor."""
         self.value_max = value_max
         self.value_min = value_min
-        # Logging
-        self._logger = logging.getLogger(' '.join([__name__, __version__]))
-        self._logger.debug(
+        try:
+            self.log_interval = abs(float(log_interval))
+        except (TypeError, ValueError):
+            self.log_interval = self.LOG_INTERVAL_DEF
+        self.reset_counters()
+        _logger.debug(
             'Instance of %s created: %s',
             self.__class__.__name__, str(self)
             )
@@ -85,6 +518,85 @@ class ValueFilter(object):
         except (TypeError, ValueError):
             self._value_max = None
 
+    @property
+    def rejected(self):
+        """Number of all rejected values."""
+        return self.rejected_high + self.rejected_low
+
+    def counters(self):
+        """Return snapshot of filtering counters.
+
+        Returns
+        -------
+        dict
+            Numbers of accepted values and values rejected as greater or
+            less than acceptable, and the most recent rejected value.
+
+        """
+        return {
+            'accepted': self.accepted,
+            'rejected_high': self.rejected_high,
+            'rejected_low': self.rejected_low,
+            'last_rejected': self.last_rejected,
+        }
+
+    def reset_counters(self):
+        """Reset filtering counters to initial state."""
+        self.accepted = 0
+        self.rejected_high = 0
+        self.rejected_low = 0
+        self.last_rejected = None
+        self._reported = 0
+        self._report_time = None
+
+    def _limit(self, value):
+        """Compare value to the acceptable value range.
+
+        Returns
+        -------
+        int
+            Positive number, if the value is greater than acceptable one,
+            negative number if less, otherwise zero.
+
+        """
+        if self._value_max is not None and value > self._value_max:
+            return 1
+        if self._value_min is not None and value < self._value_min:
+            return -1
+        return 0
+
+    def _reject(self, value, side, count=1):
+        """Count rejected value(s) and log a summary if it is time for it.
+
+        Arguments
+        ---------
+        value : float
+            The most recent rejected value.
+        side : int
+            Positive number for values greater than acceptable ones,
+            negative for less ones.
+        count : int
+            Number of rejected values at once.
+
+        """
+        if side > 0:
+            self.rejected_high += count
+        else:
+            self.rejected_low += count
+        self.last_rejected = value
+        now = time.monotonic()
+        if self._report_time is not None \
+                and now - self._report_time < self.log_interval:
+            return
+        rejected = self.rejected
+        _logger.warning(
+            'Rejected %d values by %s, totally %d greater and %d less, '
+            'last %f',
+            rejected - self._reported, str(self),
+            self.rejected_high, self.rejected_low, value)
+        self._reported = rejected
+        self._report_time = now
+
     def filter(self, value):
         """Filter value against acceptable value range.
 
@@ -102,16 +614,59 @@ class ValueFilter(object):
         """
         if value is None:
             return
-        if self.value_max is not None and value > self.value_max:
-            self._logger.warning('Rejected value %f greater than %f',
-                                 value, self.value_max)
-            return
-        if self.value_min is not None and value < self.value_min:
-            self._logger.warning('Rejected value %f less than %f',
-                                 value, self.value_min)
+        side = self._limit(value)
+        if side:
+            self._reject(value, side)
             return
+        self.accepted += 1
         return value
 
+    def filter_batch(self, values):
+        """Filter array of values against acceptable value range.
+
+        Arguments
+        ---------
+        values : array_like
+            One-dimensional array of values to be filtered. Missing values
+            are marked by ``NaN``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Copy of input values with ``NaN`` at positions of values outside
+            of the acceptable value range.
+
+        Notes
+        -----
+        - Rejected values are counted as if they were filtered one by one.
+
+        """
+        _check_numpy()
+        values = np.array(values, dtype=float).ravel()
+        valid = ~np.isnan(values)
+        high = np.zeros(values.shape, dtype=bool)
+        low = np.zeros(values.shape, dtype=bool)
+        with np.errstate(invalid='ignore'):
+            if self.value_max is not None:
+                high = values > self.value_max
+            if self.value_min is not None:
+                low = (values < self.value_min) & ~high
+        rejected = np.flatnonzero(high | low)
+        self.accepted += int(np.count_nonzero(valid)) - rejected.size
+        if rejected.size:
+            last = float(values[rejected[-1]])
+            count_high = int(np.count_nonzero(high))
+            count_low = rejected.size - count_high
+            # Report rejections with the side of the last rejected value
+            if high[rejected[-1]]:
+                self.rejected_low += count_low
+                self._reject(last, 1, count_high)
+            else:
+                self.rejected_high += count_high
+                self._reject(last, -1, count_low)
+            values[rejected] = np.nan
+        return values
+
 
 ###############################################################################
 # Abstract class as a base for all statistical filters
@@ -119,12 +674,15 @@ class ValueFilter(object):
 class StatFilter(abc.ABC):
     """Common statistical smoothing management."""
 
+    __slots__ = ('_filter', '_buffer')
+
+    _SNAPSHOT_TAG = None
+    """bytes: Four bytes identifying filter type in snapshots."""
+
     def __init__(self):
         """Create the class instance - constructor."""
         self._filter = None
-        self._buffer = []
-        # Logging
-        self._logger = logging.getLogger(' '.join([__name__, __version__]))
+        self._buffer = array('d')
 
     @abc.abstractmethod
     def __str__(self):
@@ -160,7 +718,7 @@ class StatFilter(abc.ABC):
           buffer at the end of a measurement cycle.
 
         """
-        return len([i for i in self._buffer if i is not None])
+        return len(self._buffer)
 
     @abc.abstractmethod
     def reset(self):
@@ -187,6 +745,77 @@ class StatFilter(abc.ABC):
             value = self.filter.filter(value)
         return value
 
+    def _filter_batch(self, values):
+        """Convert input values to an array and filter them.
+
+        Arguments
+        ---------
+        values : array_like
+            One-dimensional array of sample values with ``NaN`` for missing
+            ones.
+
+        Returns
+        -------
+        tuple
+            Filtered values as a float array and boolean mask of valid ones.
+
+        """
+        _check_numpy()
+        if self.filter:
+            values = self.filter.filter_batch(values)
+        else:
+            values = np.asarray(values, dtype=float).ravel()
+        return values, ~np.isnan(values)
+
+    def _dump(self, now):
+        """Return bytes of filter state with timestamps related to now."""
+        raise NotImplementedError
+
+    def _load(self, data, now):
+        """Set filter state from bytes with timestamps related to now."""
+        raise NotImplementedError
+
+    def snapshot(self):
+        """Return compact binary snapshot of the filter state.
+
+        Returns
+        -------
+        bytes
+            Filter state encoded by ``struct`` and ``array`` in little endian
+            byte order. Timestamps are stored as ages related to the time of
+            the snapshot, so that they stay valid after restart, when the
+            monotonic clock starts from other origin.
+
+        """
+        if self._SNAPSHOT_TAG is None:
+            raise NotImplementedError(
+                f'{self.__class__.__name__} does not support snapshots')
+        header = _SNAPSHOT_HEADER.pack(self._SNAPSHOT_TAG, SNAPSHOT_VERSION)
+        return header + self._dump(time.monotonic())
+
+    def restore(self, data):
+        """Restore filter state from a binary snapshot.
+
+        Arguments
+        ---------
+        data : bytes
+            Snapshot created by the method `snapshot` of the filter of the
+            same type.
+
+        Raises
+        ------
+        ValueError
+            The snapshot is of another filter type or format version.
+
+        """
+        data = memoryview(data)
+        tag, version = _SNAPSHOT_HEADER.unpack_from(data)
+        if tag != self._SNAPSHOT_TAG or version != SNAPSHOT_VERSION:
+            raise ValueError(
+                f'Snapshot {tag!r} v{version} not suitable '
+                f'for {self.__class__.__name__}')
+        self._load(data[_SNAPSHOT_HEADER.size:], time.monotonic())
+
 
 ###############################################################################
 # Exponential filtering
@@ -205,17 +834,31 @@ class Exponential(StatFilter):
         - Default value ``0.5`` means ``running average``.
         - Value ``1.0`` means ``no smoothing``.
 
+    time_constant : float
+        Positive time constant of smoothing in seconds. If it is provided,
+        the smoothing factor is not used, but the effective one is derived
+        from the time elapsed since previous sample value as
+        ``1 - exp(-elapsed / time_constant)``, so that irregularly reported
+        samples are weighted by their time intervals.
+
     """
 
+    __slots__ = ('_factor', '_time_constant', '_value', '_stamp')
+
     FACTOR_DEF = 0.5
     FACTOR_MIN = 0.0
     FACTOR_MAX = 1.0
 
-    def __init__(self, factor=FACTOR_DEF):
+    _SNAPSHOT_TAG = b'SFEX'
+    _SNAPSHOT_STATE = struct.Struct('<??dd')
+
+    def __init__(self, factor=FACTOR_DEF, time_constant=None):
         super().__init__()
         self.factor = factor
-        self._buffer.append(None)
-        self._logger.debug(
+        self.time_constant = time_constant
+        self._value = None
+        self._stamp = None
+        _logger.debug(
             'Instance of %s created: %s',
             self.__class__.__name__, str(self)
             )
@@ -224,14 +867,16 @@ class Exponential(StatFilter):
         """Represent instance object as a string."""
         msg = \
             f'ExponentialSmoothing(' \
-            f'{self.factor})'
+            f'{self.factor if self.time_constant is None else ""}' \
+            f'{"" if self.time_constant is None else f"{self.time_constant}s"})'
         return msg
 
     def __repr__(self):
         """Represent instance object officially."""
         msg = \
             f'{self.__class__.__name__}(' \
-            f'factor={repr(self.factor)})'
+            f'factor={repr(self.factor)}, ' \
+            f'time_constant={repr(self.time_constant)})'
         return msg
 
     @property
@@ -249,17 +894,61 @@ class Exponential(StatFilter):
         self._factor = max(min(abs(self._factor),
             self.FACTOR_MAX), self.FACTOR_MIN)
 
+    @property
+    def time_constant(self):
+        """Time constant of smoothing in seconds or None."""
+        return self._time_constant
+
+    @time_constant.setter
+    def time_constant(self, value):
+        """Set time constant of smoothing in seconds.
+
+        Arguments
+        ---------
+        value : float
+            Positive time constant in seconds. If None or zero is provided,
+            the smoothing factor is used instead.
+
+        """
+        try:
+            self._time_constant = abs(float(value)) or None
+        except (TypeError, ValueError):
+            self._time_constant = None
+
+    @property
+    def readings(self):
+        """Flag about existing smoothed value as a number."""
+        return int(self._value is not None)
+
     def reset(self):
         """Reset instance object to initial state."""
-        self._buffer[0] = None
-
-    def result(self, value=None):
+        self._value = None
+        self._stamp = None
+
+    def _dump(self, now):
+        """Return bytes of smoothed value and age of its timestamp."""
+        return self._SNAPSHOT_STATE.pack(
+            self._value is not None, self._stamp is not None,
+            self._value or 0.0,
+            0.0 if self._stamp is None else self._stamp - now)
+
+    def _load(self, data, now):
+        """Set smoothed value and its timestamp."""
+        has_value, has_stamp, value, age = \
+            self._SNAPSHOT_STATE.unpack_from(data)
+        self._value = value if has_value else None
+        self._stamp = now + age if has_stamp else None
+
+    def result(self, value=None, timestamp=None):
         """Calculate statistically smoothed value.
 
         Arguments
         ---------
         value : float
             Sample value to be smoothed.
+        timestamp : float
+            Monotonic time of the sample value in seconds used with the time
+            constant. If none is provided, the current monotonic time is used.
 
         Returns
         -------
@@ -278,20 +967,123 @@ class Exponential(StatFilter):
         """
         value = super().result(value)
         if value is not None:
-            if self.readings:
-                self._buffer[0] += self.factor * (value - self._buffer[0])
+            factor = self.factor
+            if self._time_constant is not None:
+                if timestamp is None:
+                    timestamp = time.monotonic()
+                if self._stamp is not None:
+                    elapsed = max(timestamp - self._stamp, 0.0)
+                    factor = 1.0 - math.exp(-elapsed / self._time_constant)
+                self._stamp = timestamp
+            if self._value is not None:
+                self._value += factor * (value - self._value)
             else:
-                self._buffer[0] = value
-            self._logger.debug(
-                'Value %s, Statistic %s',
-                value, self._buffer[0]
-                )
-        return self._buffer[0]
+                self._value = value
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    'Value %s, Statistic %s',
+                    value, self._value
+                    )
+        return self._value
+
+    def result_batch(self, values, timestamps=None):
+        """Calculate statistically smoothed values of an array of samples.
+
+        Arguments
+        ---------
+        values : array_like
+            One-dimensional array of sample values to be smoothed in order of
+            their arrival. Missing values are marked by ``NaN``.
+        timestamps : array_like
+            One-dimensional array of monotonic times of sample values in
+            seconds used with the time constant. If none is provided,
+            the current monotonic time is used for all of them.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of results as the method `result` would return them for
+            input values one by one, with ``NaN`` instead of None.
+
+        Notes
+        -----
+        - The smoothing is calculated as a vectorized recursive filter with
+          constant or time dependent smoothing factors.
+        - The instance object ends up in the same state as after processing
+          the values one by one, so that batch and single calls can be mixed.
+
+        """
+        values, mask = self._filter_batch(values)
+        previous = math.nan if self._value is None else self._value
+        samples = values[mask]
+        if samples.size:
+            start = samples[0] if self._value is None else previous
+            decay = 1.0 - self.factor
+            if self._time_constant is not None:
+                if timestamps is None:
+                    stamps = np.full(samples.shape, time.monotonic())
+                else:
+                    stamps = np.asarray(timestamps, dtype=float).ravel()[mask]
+                last = stamps[0] if self._stamp is None else self._stamp
+                elapsed = np.diff(stamps, prepend=last)
+                decay = np.exp(-np.maximum(elapsed, 0.0) / self._time_constant)
+                self._stamp = float(stamps[-1])
+            samples = _iir_batch(start, samples, decay)
+            self._value = float(samples[-1])
+        return _forward_fill(mask, samples, previous)
 
 
 ###############################################################################
 # Running statistics filtering
 ###############################################################################
+class RunningStats(object):
+    """Set of all running statistics of the same data buffer.
+
+    Attributes
+    ----------
+    avg : float
+        Mean of the data buffer.
+    med : float
+        Median of the data buffer.
+    max : float
+        Maximum of the data buffer.
+    min : float
+        Minimum of the data buffer.
+    var : float
+        Sample variance of the data buffer.
+    std : float
+        Sample standard deviation of the data buffer.
+    readings : int
+        Number of values in the data buffer.
+
+    """
+
+    __slots__ = ('avg', 'med', 'max', 'min', 'var', 'std', 'readings')
+
+    def __init__(self, avg, med, max, min, var, std, readings):
+        """Create the class instance - constructor."""
+        self.avg = avg
+        self.med = med
+        self.max = max
+        self.min = min
+        self.var = var
+        self.std = std
+        self.readings = readings
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        msg = \
+            f'{self.__class__.__name__}(' \
+            f'avg={repr(self.avg)}, ' \
+            f'med={repr(self.med)}, ' \
+            f'max={repr(self.max)}, ' \
+            f'min={repr(self.min)}, ' \
+            f'var={repr(self.var)}, ' \
+            f'std={repr(self.std)}, ' \
+            f'readings={repr(self.readings)})'
+        return msg
+
+
 class Running(StatFilter):
     """Running statistical smoothing.
 
@@ -303,24 +1095,62 @@ class Running(StatFilter):
         extended to the nearest odd one.
     def_stat : str
         Default available statistic type for general result from the list
-        'AVG', 'MED', 'MAX', 'MIN'.
+        'AVG', 'MED', 'MAX', 'MIN', 'VAR', 'STD'.
+    duration : float
+        Positive time span of the data buffer in seconds. If it is provided,
+        values older than that time span are removed from the data buffer at
+        registering new values, so that the data buffer holds just values of
+        that time window, but at most the buffer length of them.
+
+    Notes
+    -----
+    - The sample values are registered with monotonic timestamps, which are
+      provided explicitly or taken from ``time.monotonic`` at registering.
+      Timestamps are kept only if the time span of the data buffer is
+      defined.
 
     """
 
+    __slots__ = (
+        '_def_stat', '_result', '_duration', '_stamps', '_sorted', '_mins',
+        '_maxs', '_min_first', '_min_count', '_max_first', '_max_count',
+        '_head', '_count', '_sum', '_sum_comp', '_mean', '_m2', '_updates',
+    )
+
     BUFFER_LEN_DEF = 5
     """int: Default buffer length."""
 
-    STAT_TYPE = ['AVG', 'MED', 'MAX', 'MIN']
+    STAT_TYPE = ['AVG', 'MED', 'MAX', 'MIN', 'VAR', 'STD']
     """list of str: Available statistical types."""
 
+    _SNAPSHOT_TAG = b'SFRN'
+    _SNAPSHOT_STATE = struct.Struct('<III')
+
     def __init__(self,
                  buffer_len=BUFFER_LEN_DEF,
                  def_stat=STAT_TYPE[0],
+                 duration=None,
                  ):
         super().__init__()
+        self._buffer = array('d')
+        self._duration = None
+        self._stamps = None
+        self._sorted = array('d')
+        self._mins = array('l')
+        self._maxs = array('l')
+        self._min_first = self._min_count = 0
+        self._max_first = self._max_count = 0
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+        self._sum_comp = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
         self.buffer_len = buffer_len
         self.stat_type = def_stat
-        self._logger.debug(
+        self.duration = duration
+        _logger.debug(
             'Instance of %s created: %s',
             self.__class__.__name__, str(self)
             )
@@ -330,7 +1160,8 @@ class Running(StatFilter):
         msg = \
             f'RunningSmoothing(' \
             f'{self.stat_type}-' \
-            f'{self.buffer_len})'
+            f'{self.buffer_len}' \
+            f'{"" if self.duration is None else f"-{self.duration}s"})'
         return msg
 
     def __repr__(self):
@@ -338,7 +1169,8 @@ class Running(StatFilter):
         msg = \
             f'{self.__class__.__name__}(' \
             f'buffer_len={repr(self.buffer_len)}, ' \
-            f'def_stat={repr(self.stat_type)})'
+            f'def_stat={repr(self.stat_type)}, ' \
+            f'duration={repr(self.duration)})'
         return msg
 
     @property
@@ -360,18 +1192,68 @@ class Running(StatFilter):
 
     @buffer_len.setter
     def buffer_len(self, value):
-        """Adjust data buffer length for statistical smoothing."""
+        """Adjust data buffer length for statistical smoothing.
+
+        Notes
+        -----
+        - The data buffer is rebuilt with the most recent sample values, so
+          that at shrinking the buffer the oldest values are lost.
+
+        """
         try:
             # Make odd number and minimum 1
             buffer_len = abs(int(value or self.BUFFER_LEN_DEF)) | 1
-        except TypeError:
+        except (TypeError, ValueError):
             buffer_len = self.BUFFER_LEN_DEF
+        if buffer_len == self.buffer_len:
             return
-        if self.buffer_len < buffer_len:
-            self._buffer.extend([None] * (buffer_len - self.buffer_len))
-        elif self.buffer_len > buffer_len:
-            for i in range(self.buffer_len - buffer_len):
-                self._buffer.pop(i)
+        values = self._window()[-buffer_len:]
+        stamps = [None] * len(values) if self._stamps is None \
+            else self._window(self._stamps)[-buffer_len:]
+        # Arrays created by repetition are not overallocated
+        self._buffer = array('d', [0.0]) * buffer_len
+        self._mins = array('l', [0]) * buffer_len
+        self._maxs = array('l', [0]) * buffer_len
+        if self._stamps is not None:
+            self._stamps = array('d', [0.0]) * buffer_len
+        self.reset()
+        for value, stamp in zip(values, stamps):
+            self._store(value, stamp)
+
+    @property
+    def duration(self):
+        """Time span of the data buffer in seconds or None."""
+        return self._duration
+
+    @duration.setter
+    def duration(self, value):
+        """Set time span of the data buffer in seconds.
+
+        Arguments
+        ---------
+        value : float
+            Positive time span in seconds. If None or zero is provided,
+            the data buffer is limited just by its length.
+
+        Notes
+        -----
+        - Values registered before setting the time span get the current
+          monotonic time as their timestamps.
+
+        """
+        try:
+            self._duration = abs(float(value)) or None
+        except (TypeError, ValueError):
+            self._duration = None
+        if self._duration is None:
+            self._stamps = None
+        elif self._stamps is None:
+            self._stamps = array('d', [time.monotonic()]) * self.buffer_len
+
+    @property
+    def readings(self):
+        """Current number of values in data buffer."""
+        return self._count
 
     @property
     def stat_type(self):
@@ -392,85 +1274,2426 @@ class Running(StatFilter):
         def_stat = str(def_stat).upper()
         if def_stat not in self.STAT_TYPE:
             def_stat = self.STAT_TYPE[0]
-        self._def_stat = def_stat
+        # Share the statistic type string of the class instead of a copy
+        self._def_stat = self.STAT_TYPE[self.STAT_TYPE.index(def_stat)]
+        # Look up statistical method once instead of per sample. It is stored
+        # as a plain function, since a bound method would reference
+        # the instance from its own slot.
+        self._result = getattr(type(self), 'result_' + def_stat.lower())
 
-    def _register(self, value):
-        """Filter and register new value to the data buffer.
+    def _window(self, buffer=None):
+        """Return registered values ordered from the oldest to the most recent.
 
         Arguments
         ---------
-        value : float
-            Sample value to be registered in the data buffer and use for
-            statistical smoothing.
+        buffer : array
+            Ring buffer parallel to the data buffer, e.g., of timestamps.
+            If none is provided, the data buffer is used.
+
+        Returns
+        -------
+        array
+            Copy of registered values in the buffer.
+
+        """
+        if buffer is None:
+            buffer = self._buffer
+        if not self._count:
+            return buffer[:0]
+        start = (self._head - self._count) % self.buffer_len
+        if start + self._count <= self.buffer_len:
+            return buffer[start:start + self._count]
+        return buffer[start:] + buffer[:self._head]
+
+    def _add_sum(self, value):
+        """Add value to the running sum with Neumaier compensation."""
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._sum_comp += (self._sum - total) + value
+        else:
+            self._sum_comp += (value - total) + self._sum
+        self._sum = total
+
+    def _anchor(self):
+        """Recalculate running sum and sum of squared deviations exactly.
 
         Notes
         -----
-        - If the instance of statistical filter has an instance of value
-          filter, the input value is filtered against it.
-        - If new value does not fit to the filter range, it is ignored.
-        - The most recent (fresh) sample value is always in the 0 index of the
-          data buffer.
-        - Sample values are shifted to the right in the data buffer (to higher
-          indices), so that the most recent value is lost.
+        - The method is called once per buffer length of stored values, so
+          that rounding errors of incremental updates cannot accumulate in
+          long runs, while the cost per sample is still O(1).
 
         """
-        if self.filter:
-            value = self.filter.filter(value)
-        if value is not None:
-            # Shift if any real value is stored
-            if self.readings:
-                for i in range(self.buffer_len - 1, 0, -1):
-                    self._buffer[i] = self._buffer[i - 1]
-            # Storing just real value
-            self._buffer[0] = value
-        return value
+        values = self._window()
+        self._sum = math.fsum(values)
+        self._sum_comp = 0.0
+        self._mean = self._sum / self._count
+        self._m2 = math.fsum((x - self._mean) ** 2 for x in values)
+        self._updates = 0
 
-    def reset(self):
-        """Reset instance object to initial state."""
-        self._buffer = [None] * self.buffer_len
+    def _remove(self, position):
+        """Remove value at the position in data buffer from window statistics.
 
-    def _REGISTER(func):
-        """Decorate statistical function by registering its value."""
+        Arguments
+        ---------
+        position : int
+            Index of the oldest value in the data buffer.
 
-        def _decorator(self, value):
-            result = self._register(value)
-            if result is None:
-                return
-            if self.readings:
-                result = func(self, result)
-            if result is not None:
-                self._logger.debug(
-                    'Value %s, Statistic %s',
-                    value, result
-                )
-            return result
-        return _decorator
+        """
+        oldest = self._buffer[position]
+        del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+        buffer_len = len(self._buffer)
+        if self._mins[self._min_first] == position:
+            self._min_first = (self._min_first + 1) % buffer_len
+            self._min_count -= 1
+        if self._maxs[self._max_first] == position:
+            self._max_first = (self._max_first + 1) % buffer_len
+            self._max_count -= 1
+        self._count -= 1
+        if self._count:
+            self._add_sum(-oldest)
+            delta = oldest - self._mean
+            self._mean -= delta / self._count
+            self._m2 -= delta * (oldest - self._mean)
+        else:
+            self._sum = self._sum_comp = self._mean = self._m2 = 0.0
+
+    def _expire(self, timestamp):
+        """Remove values older than the time span of the data buffer.
+
+        Arguments
+        ---------
+        timestamp : float
+            Monotonic time of the most recent sample value in seconds.
+
+        """
+        limit = timestamp - self._duration
+        while self._count:
+            oldest = (self._head - self._count) % self.buffer_len
+            if self._stamps[oldest] > limit:
+                break
+            self._remove(oldest)
+
+    def _store(self, value, timestamp):
+        """Store new value to the data buffer and update window statistics.
+
+        Arguments
+        ---------
+        value : float
+            Sample value to be stored in the data buffer.
+        timestamp : float
+            Monotonic time of the sample value in seconds. It is ignored, if
+            timestamps are not kept.
+
+        Notes
+        -----
+        - The data buffer is a ring buffer with fixed capacity. The most
+          recent (fresh) sample value is stored at the head position, which
+          moves forward, so that the oldest value is overwritten.
+        - The stored values are mirrored in a sorted array, which is
+          maintained by binary search at every registration.
+        - Positions of window minimum and maximum candidates are kept in
+          monotonic queues, so that the extremes are at their first
+          positions. The queues are ring buffers of the data buffer length,
+          because the window holds at most that number of candidates.
+        - The window sum is kept with Neumaier compensation and the sum of
+          squared deviations from the mean by windowed Welford updates.
+
+        """
+        buffer = self._buffer
+        buffer_len = len(buffer)
+        head = self._head
+        if self._count == buffer_len:
+            self._remove(head)
+        self._count += 1
+        bisect.insort(self._sorted, value)
+        self._add_sum(value)
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        # Drop candidates from the last positions of the queues
+        mins = self._mins
+        first = self._min_first
+        count = self._min_count
+        while count \
+                and buffer[mins[(first + count - 1) % buffer_len]] >= value:
+            count -= 1
+        mins[(first + count) % buffer_len] = head
+        self._min_count = count + 1
+        maxs = self._maxs
+        first = self._max_first
+        count = self._max_count
+        while count \
+                and buffer[maxs[(first + count - 1) % buffer_len]] <= value:
+            count -= 1
+        maxs[(first + count) % buffer_len] = head
+        self._max_count = count + 1
+        buffer[head] = value
+        if self._stamps is not None:
+            self._stamps[head] = timestamp
+        self._head = (head + 1) % buffer_len
+        self._updates += 1
+        if self._updates >= len(buffer):
+            self._anchor()
+
+    def _register(self, value, timestamp=None):
+        """Filter and register new value to the data buffer.
+
+        Arguments
+        ---------
+        value : float
+            Sample value to be registered in the data buffer and use for
+            statistical smoothing.
+        timestamp : float
+            Monotonic time of the sample value in seconds. If none is
+            provided, the current monotonic time is used.
+
+        Notes
+        -----
+        - If the instance of statistical filter has an instance of value
+          filter, the input value is filtered against it.
+        - If new value does not fit to the filter range, it is ignored.
+        - If the time span of the data buffer is defined, values older than
+          it related to the new value are removed from the data buffer.
+
+        """
+        if self.filter:
+            value = self.filter.filter(value)
+        if value is not None:
+            if self._duration is not None:
+                if timestamp is None:
+                    timestamp = time.monotonic()
+                self._expire(timestamp)
+            self._store(value, timestamp)
+        return value
+
+    def reset(self):
+        """Reset instance object to initial state."""
+        self._head = 0
+        self._count = 0
+        del self._sorted[:]
+        self._min_first = self._min_count = 0
+        self._max_first = self._max_count = 0
+        self._sum = 0.0
+        self._sum_comp = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
+
+    def _dump(self, now):
+        """Return bytes of the data buffer with ages of its values.
+
+        Notes
+        -----
+        - Window statistics are not stored, because they are derived from
+          the data buffer at restoring.
+
+        """
+        if self._stamps is None:
+            ages = [0.0] * self._count
+        else:
+            ages = [stamp - now for stamp in self._window(self._stamps)]
+        return self._SNAPSHOT_STATE.pack(
+            self.buffer_len, self._count, self._head) \
+            + _pack_array(self._window()) \
+            + _pack_array(ages)
+
+    def _load(self, data, now):
+        """Set the data buffer and rebuild window statistics from it."""
+        buffer_len, count, head = self._SNAPSHOT_STATE.unpack_from(data)
+        if count > buffer_len or head >= buffer_len:
+            raise ValueError('Inconsistent snapshot')
+        offset = self._SNAPSHOT_STATE.size
+        values, offset = _unpack_array(data, offset, count)
+        ages, offset = _unpack_array(data, offset, count)
+        self.buffer_len = buffer_len
+        self.reset()
+        # Keep the same layout of the ring buffer
+        self._head = (head - count) % self.buffer_len
+        for value, age in zip(values, ages):
+            self._store(value, now + age)
+
+    def _REGISTER(func):
+        """Decorate statistical function by registering its value."""
+
+        def _decorator(self, value, timestamp=None):
+            result = self._register(value, timestamp)
+            if result is None:
+                return
+            if self.readings:
+                result = func(self, result)
+            if result is not None \
+                    and _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    'Value %s, Statistic %s',
+                    value, result
+                )
+            return result
+        return _decorator
 
     @_REGISTER
     def result_min(self, value=None):
         """Calculate minimum from data buffer."""
-        return min([i for i in self._buffer if i is not None])
+        return self._buffer[self._mins[self._min_first]]
 
     @_REGISTER
     def result_max(self, value=None):
         """Calculate maximum from data buffer."""
-        return max([i for i in self._buffer if i is not None])
+        return self._buffer[self._maxs[self._max_first]]
 
     @_REGISTER
     def result_avg(self, value=None):
         """Calculate mean from data buffer."""
-        l = [i for i in self._buffer if i is not None]
-        if len(l):
-            return sum(l) / len(l)
+        return (self._sum + self._sum_comp) / self._count
 
     @_REGISTER
     def result_med(self, value=None):
         """Calculate median from data buffer."""
-        l = self.readings
-        if l:
-            return self._buffer[l // 2]
+        return self._median()
 
-    def result(self, value=None):
+    def _median(self):
+        """Return median of registered values.
+
+        Notes
+        -----
+        - For even number of registered values the mean of both middle values
+          is returned.
+
+        """
+        i = self._count // 2
+        if self._count % 2:
+            return self._sorted[i]
+        return (self._sorted[i - 1] + self._sorted[i]) / 2
+
+    def _variance(self):
+        """Return sample variance of registered values.
+
+        Notes
+        -----
+        - For a single registered value or equal values the variance is
+          exactly zero regardless of rounding errors of incremental updates.
+
+        """
+        buffer = self._buffer
+        if buffer[self._mins[self._min_first]] \
+                == buffer[self._maxs[self._max_first]]:
+            return 0.0
+        return max(self._m2, 0.0) / (self._count - 1)
+
+    @_REGISTER
+    def result_var(self, value=None):
+        """Calculate sample variance from data buffer."""
+        return self._variance()
+
+    @_REGISTER
+    def result_std(self, value=None):
+        """Calculate sample standard deviation from data buffer."""
+        return math.sqrt(self._variance())
+
+    @_REGISTER
+    def result_all(self, value=None):
+        """Calculate all statistics from data buffer at once.
+
+        Returns
+        -------
+        RunningStats
+            Object with all available statistics of the data buffer
+            including the input value.
+
+        Notes
+        -----
+        - The input value is registered just once and all statistics are
+          taken from incrementally maintained window state, so that it is
+          cheaper than calling particular statistical methods.
+
+        """
+        var = self._variance()
+        return RunningStats(
+            (self._sum + self._sum_comp) / self._count,
+            self._median(),
+            self._buffer[self._maxs[self._max_first]],
+            self._buffer[self._mins[self._min_first]],
+            var,
+            math.sqrt(var),
+            self._count,
+        )
+
+    def _statistic(self, stat_type):
+        """Return statistic of registered values without registering any."""
+        if stat_type == 'AVG':
+            return (self._sum + self._sum_comp) / self._count
+        if stat_type == 'MED':
+            return self._median()
+        if stat_type == 'MAX':
+            return self._buffer[self._maxs[self._max_first]]
+        if stat_type == 'MIN':
+            return self._buffer[self._mins[self._min_first]]
+        if stat_type == 'VAR':
+            return self._variance()
+        if stat_type == 'STD':
+            return math.sqrt(self._variance())
+
+    def result_batch(self, values, stat_type=None, timestamps=None):
+        """Calculate running statistic of an array of samples.
+
+        Arguments
+        ---------
+        values : array_like
+            One-dimensional array of sample values in order of their arrival.
+            Missing values are marked by ``NaN``.
+        stat_type : str
+            Abbreviation of calculated statistic type. If none is provided,
+            the default statistic type is used.
+        timestamps : array_like
+            One-dimensional array of monotonic times of sample values in
+            seconds. If none is provided, the current monotonic time is used
+            for all of them.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of results as the corresponding statistical method would
+            return them for input values one by one, with ``NaN`` instead
+            of None.
+
+        Notes
+        -----
+        - The statistic is calculated by vectorized reductions over strided
+          sliding windows, which are processed in chunks in order to limit
+          memory consumption.
+        - If the time span of the data buffer is defined, windows have
+          variable length, so that the values are registered one by one with
+          incrementally updated statistics.
+        - The instance object ends up in the same state as after processing
+          the values one by one, so that batch and single calls can be mixed.
+
+        """
+        values, mask = self._filter_batch(values)
+        stat_type = str(stat_type or self.stat_type).upper()
+        if stat_type not in self.STAT_TYPE:
+            stat_type = self.stat_type
+        if timestamps is None:
+            timestamps = np.full(values.shape, time.monotonic())
+        else:
+            timestamps = np.asarray(timestamps, dtype=float).ravel()
+        samples = values[mask]
+        stamps = timestamps[mask]
+        result = np.full(values.shape, np.nan)
+        if not samples.size:
+            return result
+        if self._duration is not None:
+            stats = np.empty(samples.size)
+            for i, (value, stamp) in enumerate(zip(samples.tolist(),
+                                                   stamps.tolist())):
+                self._expire(stamp)
+                self._store(value, stamp)
+                stats[i] = self._statistic(stat_type)
+            result[mask] = stats
+            return result
+        buffer_len = self.buffer_len
+        # Prepend current window padded by missing values to full length
+        window = np.array(self._window(), dtype=float)
+        prefix = window[max(window.size - buffer_len + 1, 0):]
+        partial = buffer_len - 1 - prefix.size
+        data = np.concatenate((np.full(partial, np.nan), prefix, samples))
+        windows = np.lib.stride_tricks.sliding_window_view(data, buffer_len)
+        stats = np.empty(samples.size)
+        chunk = max(_BATCH_CHUNK // buffer_len, 1)
+        for i in range(0, samples.size, chunk):
+            j = min(i + chunk, samples.size)
+            stats[i:j] = _window_stat(stat_type, windows[i:j], i < partial)
+        result[mask] = stats
+        # Store the recent window in the same layout as one by one
+        count = min(window.size + samples.size, buffer_len)
+        head = (self._head + samples.size) % buffer_len
+        if self._stamps is None:
+            stamps = [None] * count
+        else:
+            stamps = np.concatenate((
+                np.array(self._window(self._stamps), dtype=float), stamps)
+            ).tolist()
+        self.reset()
+        self._head = (head - count) % buffer_len
+        for value, stamp in zip(data[-count:].tolist(), stamps[-count:]):
+            self._store(value, stamp)
+        return result
+
+    def result(self, value=None, timestamp=None):
         """Calculate default statistic from data buffer."""
-        func = eval('self.result_' + self._def_stat.lower())
-        return func(value)
+        return self._result(self, value, timestamp)
+
+
+
+###############################################################################
+# Bank of running statistics filters
+###############################################################################
+class FilterBank(object):
+    """Running statistical smoothing of multiple channels at once.
+
+    Arguments
+    ---------
+    channels : int
+        Positive integer number of independent channels, e.g., sensors,
+        smoothed by the bank.
+    buffer_len : int
+        Positive integer number of values held in the data buffer of each
+        channel. It should be an odd number, otherwise it is extended to the
+        nearest odd one.
+    def_stat : str
+        Default available statistic type for general result from the list
+        of statistic types of running statistics.
+    value_max : float | array_like
+        Maximal acceptable value for all channels or for each of them.
+        ``NaN`` means no limit.
+    value_min : float | array_like
+        Minimal acceptable value for all channels or for each of them.
+        ``NaN`` means no limit.
+    log_interval : float
+        Minimal interval in seconds between warnings about rejected values.
+
+    Notes
+    -----
+    - Data buffers of all channels are kept in a single two-dimensional
+      array, so that all channels are updated by a vectorized step from one
+      vector of new readings.
+    - Rejected values are counted for each channel and summarized in
+      a warning at most once per logging interval.
+    - The bank requires the package ``numpy``.
+
+    See Also
+    --------
+    Running : Running statistical smoothing of a single channel.
+
+    """
+
+    __slots__ = (
+        '_channels', '_def_stat', '_value_max', '_value_min', '_buffer',
+        '_head', '_count', 'log_interval', 'rejected_high', 'rejected_low',
+        '_report_time', '_reported',
+    )
+
+    def __init__(self,
+                 channels,
+                 buffer_len=Running.BUFFER_LEN_DEF,
+                 def_stat=Running.STAT_TYPE[0],
+                 value_max=None,
+                 value_min=None,
+                 log_interval=ValueFilter.LOG_INTERVAL_DEF,
+                 ):
+        """Create the class instance - constructor."""
+        _check_numpy()
+        self._channels = max(abs(int(channels)), 1)
+        try:
+            # Make odd number and minimum 1
+            buffer_len = abs(int(buffer_len or Running.BUFFER_LEN_DEF)) | 1
+        except (TypeError, ValueError):
+            buffer_len = Running.BUFFER_LEN_DEF
+        self._buffer = np.full((self._channels, buffer_len), np.nan)
+        self._head = np.zeros(self._channels, dtype=np.intp)
+        self._count = np.zeros(self._channels, dtype=np.intp)
+        self.stat_type = def_stat
+        self.value_max = value_max
+        self.value_min = value_min
+        try:
+            self.log_interval = abs(float(log_interval))
+        except (TypeError, ValueError):
+            self.log_interval = ValueFilter.LOG_INTERVAL_DEF
+        self.reset_counters()
+        _logger.debug(
+            'Instance of %s created: %s',
+            self.__class__.__name__, str(self)
+            )
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        msg = \
+            f'FilterBank(' \
+            f'{self.channels}x' \
+            f'{self.stat_type}-' \
+            f'{self.buffer_len})'
+        return msg
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        msg = \
+            f'{self.__class__.__name__}(' \
+            f'channels={repr(self.channels)}, ' \
+            f'buffer_len={repr(self.buffer_len)}, ' \
+            f'def_stat={repr(self.stat_type)})'
+        return msg
+
+    @property
+    def channels(self):
+        """Number of smoothed channels."""
+        return self._channels
+
+    @property
+    def buffer_len(self):
+        """Real length of the data buffer of each channel."""
+        return self._buffer.shape[1]
+
+    @property
+    def readings(self):
+        """Array of current numbers of values in data buffers of channels."""
+        return self._count.copy()
+
+    @property
+    def stat_type(self):
+        """Default statistic type for general result."""
+        return self._def_stat
+
+    @stat_type.setter
+    def stat_type(self, def_stat):
+        """Set default statistic type for general result.
+
+        Arguments
+        ---------
+        def_stat : str
+            Enumerated abbreviation from available statistic types.
+            If unknown one provided, the default one is set.
+
+        """
+        def_stat = str(def_stat).upper()
+        if def_stat not in Running.STAT_TYPE:
+            def_stat = Running.STAT_TYPE[0]
+        self._def_stat = def_stat
+
+    def _limits(self, value):
+        """Convert limit value(s) to an array of channel limits."""
+        if value is None:
+            value = np.nan
+        limits = np.array(value, dtype=float).ravel()
+        return np.broadcast_to(limits, (self._channels,)).copy()
+
+    @property
+    def value_max(self):
+        """Array of maximal acceptable values of channels."""
+        return self._value_max
+
+    @value_max.setter
+    def value_max(self, value):
+        """Set maximal acceptable values for all channels or each of them."""
+        self._value_max = self._limits(value)
+
+    @property
+    def value_min(self):
+        """Array of minimal acceptable values of channels."""
+        return self._value_min
+
+    @value_min.setter
+    def value_min(self, value):
+        """Set minimal acceptable values for all channels or each of them."""
+        self._value_min = self._limits(value)
+
+    @property
+    def rejected(self):
+        """Array of numbers of all rejected values of channels."""
+        return self.rejected_high + self.rejected_low
+
+    def reset_counters(self):
+        """Reset counters of rejected values of all channels."""
+        self.rejected_high = np.zeros(self._channels, dtype=np.int64)
+        self.rejected_low = np.zeros(self._channels, dtype=np.int64)
+        self._reported = 0
+        self._report_time = None
+
+    def _reject(self, high, low):
+        """Count rejected values and log a summary if it is time for it.
+
+        Arguments
+        ---------
+        high : numpy.ndarray
+            Boolean mask of channels with values greater than acceptable.
+        low : numpy.ndarray
+            Boolean mask of channels with values less than acceptable.
+
+        """
+        self.rejected_high += high
+        self.rejected_low += low
+        now = time.monotonic()
+        if self._report_time is not None \
+                and now - self._report_time < self.log_interval:
+            return
+        rejected = self.rejected
+        total = int(rejected.sum())
+        _logger.warning(
+            'Rejected %d values by %s, totally %d in %d channels',
+            total - self._reported, str(self),
+            total, np.count_nonzero(rejected))
+        self._reported = total
+        self._report_time = now
+
+    def reset(self, channel=None):
+        """Reset all channels or the provided one to initial state."""
+        if channel is None:
+            channel = slice(None)
+        self._buffer[channel] = np.nan
+        self._head[channel] = 0
+        self._count[channel] = 0
+
+    def _register(self, values):
+        """Filter and register new values to data buffers of channels.
+
+        Arguments
+        ---------
+        values : array_like
+            Vector of sample values for all channels. Missing values are
+            marked by ``NaN``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Indices of channels with registered values.
+
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size != self._channels:
+            raise ValueError(
+                f'Expected {self._channels} values, got {values.size}')
+        with np.errstate(invalid='ignore'):
+            high = values > self._value_max
+            low = values < self._value_min
+        rejected = high | low
+        if rejected.any():
+            self._reject(high, low)
+        rows = np.flatnonzero(~(rejected | np.isnan(values)))
+        heads = self._head[rows]
+        self._buffer[rows, heads] = values[rows]
+        self._head[rows] = (heads + 1) % self.buffer_len
+        self._count[rows] = np.minimum(self._count[rows] + 1, self.buffer_len)
+        return rows
+
+    def result(self, values, stat_type=None):
+        """Register new values and calculate statistic of all channels.
+
+        Arguments
+        ---------
+        values : array_like
+            Vector of sample values for all channels. Missing values are
+            marked by ``NaN``.
+        stat_type : str
+            Abbreviation of calculated statistic type. If none is provided,
+            the default statistic type is used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Vector of statistics of channels. Channels without registered
+            value at this step have ``NaN`` like the running statistics
+            returns None.
+
+        """
+        stat_type = str(stat_type or self.stat_type).upper()
+        if stat_type not in Running.STAT_TYPE:
+            stat_type = self.stat_type
+        rows = self._register(values)
+        result = np.full(self._channels, np.nan)
+        if rows.size:
+            result[rows] = _window_stat(stat_type, self._buffer[rows], True)
+        return result
+
+
+###############################################################################
+# Streaming quantile estimation
+###############################################################################
+class Quantile(StatFilter):
+    """Quantile estimation by a merging t-digest sketch.
+
+    Arguments
+    ---------
+    quantile : float
+        Default quantile for general result in the range ``0.0 ~ 1.0``.
+        The input value is limited to that range.
+    compression : int
+        Positive integer compression parameter of the digest. It limits the
+        number of centroids to about the double of it and determines the
+        accuracy of the estimation.
+
+    Notes
+    -----
+    - The digest summarizes any number of sample values in constant memory
+      by weighted centroids, which are smaller in the tails of the
+      distribution, so that extreme quantiles like 0.99 are estimated
+      accurately.
+    - New sample values are collected in an input buffer, which is merged
+      with centroids, when it reaches the total weight of centroids, but at
+      most ``BUFFER_FACTOR`` multiple of the compression of values. So that
+      the sorting and merging cost is amortized over many sample values.
+    - The method `result` estimates the default quantile from centroids
+      without merging the input buffer and keeps the estimation until the
+      next merge. The methods `estimate`, `merge`, and `snapshot` merge
+      the input buffer at first.
+    - Digests from various sources can be merged into one by the method
+      `merge`, e.g., in order to obtain fleet-wide percentiles.
+
+    """
+
+    __slots__ = (
+        '_quantile', '_compression', '_means', '_weights', '_total', '_min',
+        '_max', '_estimated',
+    )
+
+    QUANTILE_DEF = 0.5
+    """float: Default estimated quantile."""
+
+    COMPRESSION_DEF = 100
+    """int: Default compression of the digest."""
+
+    BUFFER_FACTOR = 5
+    """int: Multiple of compression for the length of the input buffer."""
+
+    _SNAPSHOT_TAG = b'SFQT'
+    _SNAPSHOT_STATE = struct.Struct('<Idd')
+
+    def __init__(self,
+                 quantile=QUANTILE_DEF,
+                 compression=COMPRESSION_DEF,
+                 ):
+        super().__init__()
+        self._estimated = None
+        self.quantile = quantile
+        try:
+            self._compression = max(abs(int(compression)), 1)
+        except (TypeError, ValueError):
+            self._compression = self.COMPRESSION_DEF
+        self._means = array('d')
+        self._weights = array('d')
+        self._buffer = array('d')
+        self._total = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        _logger.debug(
+            'Instance of %s created: %s',
+            self.__class__.__name__, str(self)
+            )
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        msg = \
+            f'QuantileDigest(' \
+            f'{self.quantile}-' \
+            f'{self.compression})'
+        return msg
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        msg = \
+            f'{self.__class__.__name__}(' \
+            f'quantile={repr(self.quantile)}, ' \
+            f'compression={repr(self.compression)})'
+        return msg
+
+    @property
+    def quantile(self):
+        """Default quantile for general result."""
+        return self._quantile
+
+    @quantile.setter
+    def quantile(self, value):
+        """Set default quantile for general result."""
+        try:
+            self._quantile = float(value)
+        except (TypeError, ValueError):
+            self._quantile = self.QUANTILE_DEF
+        self._quantile = max(min(self._quantile, 1.0), 0.0)
+        self._estimated = None
+
+    @property
+    def compression(self):
+        """Compression parameter of the digest."""
+        return self._compression
+
+    @property
+    def readings(self):
+        """Number of values summarized in the digest."""
+        return int(self._total + len(self._buffer))
+
+    def reset(self):
+        """Reset instance object to initial state."""
+        del self._means[:]
+        del self._weights[:]
+        del self._buffer[:]
+        self._total = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._estimated = None
+
+    def _dump(self, now):
+        """Return bytes of centroids of the digest."""
+        self._merge()
+        return self._SNAPSHOT_STATE.pack(
+            len(self._means), self._min, self._max) \
+            + _pack_array(self._means) + _pack_array(self._weights)
+
+    def _load(self, data, now):
+        """Set centroids of the digest."""
+        count, value_min, value_max = self._SNAPSHOT_STATE.unpack_from(data)
+        offset = self._SNAPSHOT_STATE.size
+        means, offset = _unpack_array(data, offset, count)
+        weights, offset = _unpack_array(data, offset, count)
+        self.reset()
+        self._means = means
+        self._weights = weights
+        self._total = sum(weights)
+        self._min = value_min
+        self._max = value_max
+
+    def _scale(self, q):
+        """Return scale function value of the quantile."""
+        return self._compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _scale_inv(self, k):
+        """Return quantile for scale function value."""
+        return (math.sin(2 * math.pi * k / self._compression) + 1) / 2
+
+    def _merge(self, means=(), weights=()):
+        """Merge buffered values and other centroids to the digest.
+
+        Arguments
+        ---------
+        means : sequence of float
+            Means of additional centroids.
+        weights : sequence of float
+            Weights of additional centroids.
+
+        """
+        if not (self._buffer or means):
+            return
+        items = sorted(
+            list(zip(self._means, self._weights))
+            + list(zip(means, weights))
+            + [(value, 1.0) for value in self._buffer]
+        )
+        del self._buffer[:]
+        total = sum(weight for _, weight in items)
+        means = array('d')
+        weights = array('d')
+        cum_weight = 0.0
+        q_limit = self._scale_inv(self._scale(0.0) + 1)
+        mean, weight = items[0]
+        for item_mean, item_weight in items[1:]:
+            if (cum_weight + weight + item_weight) / total <= q_limit:
+                # Merge item to the current centroid
+                weight += item_weight
+                mean += (item_mean - mean) * item_weight / weight
+            else:
+                means.append(mean)
+                weights.append(weight)
+                cum_weight += weight
+                q_limit = self._scale_inv(
+                    self._scale(min(cum_weight / total, 1.0)) + 1)
+                mean, weight = item_mean, item_weight
+        means.append(mean)
+        weights.append(weight)
+        self._means = means
+        self._weights = weights
+        self._total = total
+        self._estimated = None
+
+    def _register(self, value):
+        """Filter and register new value to the input buffer."""
+        value = super().result(value)
+        if value is not None:
+            self._buffer.append(value)
+            self._min = min(self._min, value)
+            self._max = max(self._max, value)
+            if len(self._buffer) >= min(
+                    self.BUFFER_FACTOR * self._compression,
+                    max(self._total, 1.0)):
+                self._merge()
+        return value
+
+    def _interpolate(self, quantile):
+        """Return quantile estimated from centroids or None without them."""
+        if not self._total:
+            return
+        means = self._means
+        weights = self._weights
+        index = quantile * self._total
+        # Interpolate between centers of neighbouring centroids
+        center = weights[0] / 2
+        if index <= center:
+            if center <= 0.5:
+                return means[0]
+            return self._min + (means[0] - self._min) * index / center
+        for i in range(1, len(means)):
+            next_center = center + (weights[i - 1] + weights[i]) / 2
+            if index <= next_center:
+                ratio = (index - center) / (next_center - center)
+                return means[i - 1] + (means[i] - means[i - 1]) * ratio
+            center = next_center
+        tail = self._total - center
+        if tail <= 0.5:
+            return means[-1]
+        return means[-1] + (self._max - means[-1]) * (index - center) / tail
+
+    def estimate(self, quantile=None):
+        """Estimate quantile of summarized values.
+
+        Arguments
+        ---------
+        quantile : float
+            Estimated quantile in the range ``0.0 ~ 1.0``. If none is
+            provided, the default quantile is used.
+
+        Returns
+        -------
+        float | None
+            Estimated quantile or None, if no value has been summarized yet.
+
+        Notes
+        -----
+        - The input buffer is merged with centroids at first, so that
+          the estimation includes all registered values.
+
+        """
+        self._merge()
+        if quantile is None:
+            quantile = self.quantile
+        return self._interpolate(max(min(float(quantile), 1.0), 0.0))
+
+    def merge(self, *digests):
+        """Merge other digests into this one.
+
+        Arguments
+        ---------
+        digests : Quantile
+            One or more digests, which summaries are added to this one.
+            The merged digests stay untouched.
+
+        """
+        means = array('d')
+        weights = array('d')
+        for digest in digests:
+            if not isinstance(digest, Quantile):
+                continue
+            digest._merge()
+            means.extend(digest._means)
+            weights.extend(digest._weights)
+            self._min = min(self._min, digest._min)
+            self._max = max(self._max, digest._max)
+        self._merge(means, weights)
+
+    def result(self, value=None):
+        """Register sample value and estimate the default quantile.
+
+        Arguments
+        ---------
+        value : float
+            Sample value to be summarized.
+
+        Returns
+        -------
+        float | None
+            Estimated default quantile of merged values. If None input value
+            is provided, the recent estimation is returned.
+
+        Notes
+        -----
+        - Values in the input buffer are not included in the estimation until
+          the buffer is merged, so that the cost per sample value stays low.
+
+        """
+        self._register(value)
+        if self._estimated is None:
+            self._estimated = self._interpolate(self._quantile)
+        return self._estimated
+
+
+###############################################################################
+# Outlier filters
+###############################################################################
+class OutlierFilter(ValueFilter):
+    """Common rejection of outliers related to a rolling window of values.
+
+    Arguments
+    ---------
+    window_len : int
+        Positive integer number of recent values, which the outliers are
+        detected against. It should be an odd number, otherwise it is
+        extended to the nearest odd one.
+    threshold : float
+        Positive multiple of the rolling scale of values, which a deviation
+        of a value from the rolling center may reach at most.
+    value_max : float
+        Maximal acceptable value.
+    value_min : float
+        Minimal acceptable value.
+
+    Notes
+    -----
+    - Every input value within the acceptable range is registered in the
+      rolling window, even the rejected outlier, so that the filter follows
+      the level shift of values. Subclasses may register an outlier changed
+      by the method `_outlier`, unless the rolling scale is zero.
+    - Values are not rejected until the window contains at least
+      ``READINGS_MIN`` values.
+    - Outliers are counted as rejected values greater or less than
+      acceptable ones according to the sign of their deviation.
+
+    """
+
+    __slots__ = ('_threshold', '_window')
+
+    WINDOW_LEN_DEF = 15
+    """int: Default length of the rolling window."""
+
+    THRESHOLD_DEF = 3.0
+    """float: Default threshold of deviations."""
+
+    READINGS_MIN = 3
+    """int: Minimal number of values in the window for rejecting outliers."""
+
+    def __init__(self,
+                 window_len=WINDOW_LEN_DEF,
+                 threshold=THRESHOLD_DEF,
+                 value_max=None,
+                 value_min=None,
+                 log_interval=ValueFilter.LOG_INTERVAL_DEF,
+                 ):
+        """Create the class instance - constructor."""
+        self._window = Running(window_len)
+        try:
+            self._threshold = abs(float(threshold))
+        except (TypeError, ValueError):
+            self._threshold = self.THRESHOLD_DEF
+        super().__init__(value_max, value_min, log_interval)
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        msg = \
+            f'{self.__class__.__name__}(' \
+            f'{self.threshold}x' \
+            f'{self.window_len}, ' \
+            f'{self.value_min}~' \
+            f'{self.value_max})'
+        return msg
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        msg = \
+            f'{self.__class__.__name__}(' \
+            f'window_len={repr(self.window_len)}, ' \
+            f'threshold={repr(self.threshold)}, ' \
+            f'value_max={repr(self.value_max)}, ' \
+            f'value_min={repr(self.value_min)})'
+        return msg
+
+    @property
+    def window_len(self):
+        """Real length of the rolling window."""
+        return self._window.buffer_len
+
+    @property
+    def threshold(self):
+        """Threshold of deviations as a multiple of the rolling scale."""
+        return self._threshold
+
+    def reset(self):
+        """Reset rolling window and counters to initial state."""
+        self._window.reset()
+        self.reset_counters()
+
+    def _center_scale(self):
+        """Return rolling center and scale of the window values."""
+        raise NotImplementedError
+
+    def _outlier(self, value, limit):
+        """Return value of an outlier registered in the rolling window.
+
+        Arguments
+        ---------
+        value : float
+            Rejected outlier.
+        limit : float
+            The nearest acceptable value on the side of the outlier.
+
+        """
+        return value
+
+    def filter(self, value):
+        """Filter value against acceptable range and rolling window.
+
+        Arguments
+        ---------
+        value : float
+            Value to be filtered.
+
+        Returns
+        -------
+        float | None
+            If the input value is outside of the acceptable value range or
+            its deviation from the rolling center exceeds the threshold
+            multiple of the rolling scale, None is returned, otherwise that
+            value.
+
+        """
+        if value is None:
+            return
+        side = self._limit(value)
+        if side:
+            self._reject(value, side)
+            return
+        window = self._window
+        stored = value
+        if window.readings >= self.READINGS_MIN:
+            center, scale = self._center_scale()
+            bound = self._threshold * scale
+            if abs(value - center) > bound:
+                side = 1 if value > center else -1
+                # A window of equal values has zero scale and would never
+                # change with changed outliers, so it gets the raw value
+                if bound > 0:
+                    stored = self._outlier(value, center + side * bound)
+        window._store(stored, 0.0)
+        if side:
+            self._reject(value, side)
+            return
+        self.accepted += 1
+        return value
+
+    def filter_batch(self, values):
+        """Filter array of values against acceptable range and rolling window.
+
+        Notes
+        -----
+        - Values are processed one by one, because each of them updates
+          the rolling window.
+
+        """
+        _check_numpy()
+        values = np.array(values, dtype=float).ravel()
+        for i, value in enumerate(values.tolist()):
+            if not math.isnan(value) and self.filter(value) is None:
+                values[i] = np.nan
+        return values
+
+
+class ZScoreFilter(OutlierFilter):
+    """Rejection of outliers by rolling z-score.
+
+    A value is rejected, if its deviation from the rolling mean exceeds
+    the threshold multiple of the rolling standard deviation. The mean and
+    variance are updated incrementally in O(1) per value.
+
+    Notes
+    -----
+    - An outlier is registered in the rolling window clamped to the nearest
+      acceptable value, so that a single spike does not inflate the standard
+      deviation and let pass subsequent outliers.
+    - A window of constant values has zero standard deviation, so that any
+      different value is rejected, but it is registered unchanged, so that
+      the filter follows a level shift of quantized values.
+
+    """
+
+    __slots__ = ()
+
+    def _center_scale(self):
+        """Return rolling mean and standard deviation."""
+        window = self._window
+        return window._statistic('AVG'), window._statistic('STD')
+
+    def _outlier(self, value, limit):
+        """Return outlier clamped to the nearest acceptable value."""
+        return limit
+
+
+class HampelFilter(OutlierFilter):
+    """Rejection of outliers by rolling median absolute deviation.
+
+    A value is rejected, if its deviation from the rolling median exceeds
+    the threshold multiple of the scaled median absolute deviation (MAD),
+    which is a robust estimate of the standard deviation. The median is
+    maintained in a sorted window and MAD is selected from it by binary
+    search in O(log n) per value.
+
+    """
+
+    __slots__ = ()
+
+    MAD_SCALE = 1.4826
+    """float: Factor of MAD estimating standard deviation of normal data."""
+
+    def _center_scale(self):
+        """Return rolling median and scaled median absolute deviation."""
+        window = self._window
+        values = window._sorted
+        center = window._median()
+        count = len(values)
+        mad = _kth_deviation(values, center, count // 2)
+        if not count % 2:
+            mad = (mad + _kth_deviation(values, center, count // 2 - 1)) / 2
+        return center, self.MAD_SCALE * mad
+
+
+###############################################################################
+# Decimation to interval summaries
+###############################################################################
+class IntervalSummary(object):
+    """Summary of sample values within a time interval.
+
+    Attributes
+    ----------
+    start : float
+        Monotonic time of the interval start in seconds.
+    count : int
+        Number of values in the interval.
+    min : float
+        Minimum of values in the interval.
+    max : float
+        Maximum of values in the interval.
+    mean : float
+        Mean of values in the interval.
+    last : float
+        The most recent value in the interval.
+    std : float | None
+        Sample standard deviation of values in the interval, if it is
+        required by the decimator, otherwise None.
+
+    """
+
+    __slots__ = ('start', 'count', 'min', 'max', 'mean', 'last', 'std')
+
+    def __init__(self, start, count, min, max, mean, last, std=None):
+        """Create the class instance - constructor."""
+        self.start = start
+        self.count = count
+        self.min = min
+        self.max = max
+        self.mean = mean
+        self.last = last
+        self.std = std
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        msg = \
+            f'{self.__class__.__name__}(' \
+            f'start={repr(self.start)}, ' \
+            f'count={repr(self.count)}, ' \
+            f'min={repr(self.min)}, ' \
+            f'max={repr(self.max)}, ' \
+            f'mean={repr(self.mean)}, ' \
+            f'last={repr(self.last)}, ' \
+            f'std={repr(self.std)})'
+        return msg
+
+
+class Decimator(StatFilter):
+    """Aggregation of sample values into summaries of fixed time intervals.
+
+    Arguments
+    ---------
+    interval : float
+        Positive length of aggregation intervals in seconds.
+    std : bool
+        Flag about calculating standard deviation of values in intervals.
+
+    Notes
+    -----
+    - Intervals are aligned to multiples of their length on the monotonic
+      clock, which the timestamps of sample values are related to.
+    - Only aggregates of the current interval are kept, so that the memory
+      consumption does not depend on the sampling rate.
+    - An interval is closed and its summary is returned at registering the
+      first sample value or timestamp from a next interval.
+
+    """
+
+    __slots__ = (
+        '_interval', '_std', '_index', '_count', '_min', '_max', '_mean',
+        '_m2', '_last',
+    )
+
+    INTERVAL_DEF = 15.0
+    """float: Default length of aggregation intervals in seconds."""
+
+    SUMMARY_DTYPE = [
+        ('start', 'f8'), ('count', 'i8'),
+        ('min', 'f8'), ('max', 'f8'), ('mean', 'f8'),
+        ('last', 'f8'), ('std', 'f8'),
+    ]
+    """list of tuple: Fields of structured array of batch summaries."""
+
+    _SNAPSHOT_TAG = b'SFDC'
+    _SNAPSHOT_STATE = struct.Struct('<Qddddddd')
+
+    def __init__(self, interval=INTERVAL_DEF, std=False):
+        super().__init__()
+        try:
+            self._interval = abs(float(interval)) or self.INTERVAL_DEF
+        except (TypeError, ValueError):
+            self._interval = self.INTERVAL_DEF
+        self._std = bool(std)
+        self.reset()
+        _logger.debug(
+            'Instance of %s created: %s',
+            self.__class__.__name__, str(self)
+            )
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        msg = \
+            f'Decimator(' \
+            f'{self.interval}s' \
+            f'{"-STD" if self._std else ""})'
+        return msg
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        msg = \
+            f'{self.__class__.__name__}(' \
+            f'interval={repr(self.interval)}, ' \
+            f'std={repr(self._std)})'
+        return msg
+
+    @property
+    def interval(self):
+        """Length of aggregation intervals in seconds."""
+        return self._interval
+
+    @property
+    def readings(self):
+        """Number of values in the current interval."""
+        return self._count
+
+    def reset(self):
+        """Reset instance object to initial state."""
+        self._index = None
+        self._count = 0
+        self._min = math.inf
+        self._max = -math.inf
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._last = None
+
+    def _dump(self, now):
+        """Return bytes of aggregates of the current interval."""
+        age = 0.0 if self._index is None else self._index * self._interval - now
+        return self._SNAPSHOT_STATE.pack(
+            self._count, age, self._min, self._max, self._mean, self._m2,
+            0.0 if self._last is None else self._last, self._interval)
+
+    def _load(self, data, now):
+        """Set aggregates of the current interval."""
+        count, age, value_min, value_max, mean, m2, last, interval = \
+            self._SNAPSHOT_STATE.unpack_from(data)
+        if interval != self._interval:
+            raise ValueError('Snapshot of other interval')
+        self.reset()
+        if count:
+            self._index = math.floor((now + age) / self._interval + 0.5)
+            self._count = count
+            self._min = value_min
+            self._max = value_max
+            self._mean = mean
+            self._m2 = m2
+            self._last = last
+
+    def _merge(self, count, min, max, mean, m2, last):
+        """Merge aggregates of a group of values to the current interval."""
+        total = self._count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta * delta * self._count * count / total
+        self._count = total
+        self._min = min if min < self._min else self._min
+        self._max = max if max > self._max else self._max
+        self._last = last
+
+    def flush(self):
+        """Close the current interval and return its summary.
+
+        Returns
+        -------
+        IntervalSummary | None
+            Summary of the current interval or None, if it has no values.
+
+        """
+        if not self._count:
+            return
+        std = None
+        if self._std:
+            std = math.sqrt(max(self._m2, 0.0) / (self._count - 1)) \
+                if self._count > 1 else 0.0
+        summary = IntervalSummary(
+            self._index * self._interval, self._count,
+            self._min, self._max, self._mean, self._last, std)
+        self.reset()
+        return summary
+
+    def result(self, value=None, timestamp=None):
+        """Register sample value and return summary of a closed interval.
+
+        Arguments
+        ---------
+        value : float
+            Sample value to be aggregated. If None is provided, just closing
+            of the current interval is checked.
+        timestamp : float
+            Monotonic time of the sample value in seconds. If none is
+            provided, the current monotonic time is used.
+
+        Returns
+        -------
+        IntervalSummary | None
+            Summary of the previous interval, if the timestamp falls to
+            a next interval, otherwise None.
+
+        """
+        value = super().result(value)
+        if timestamp is None:
+            timestamp = time.monotonic()
+        index = math.floor(timestamp / self._interval)
+        summary = None
+        if self._index is not None and index != self._index:
+            summary = self.flush()
+        if value is not None:
+            self._index = index
+            self._count += 1
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+            if value < self._min:
+                self._min = value
+            if value > self._max:
+                self._max = value
+            self._last = value
+        return summary
+
+    def result_batch(self, values, timestamps):
+        """Aggregate arrays of sample values into interval summaries.
+
+        Arguments
+        ---------
+        values : array_like
+            One-dimensional array of sample values in order of their arrival.
+            Missing values are marked by ``NaN``.
+        timestamps : array_like
+            One-dimensional array of nondecreasing monotonic times of sample
+            values in seconds.
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array with fields of ``SUMMARY_DTYPE`` with summaries
+            of closed intervals, as the method `result` would return them for
+            input values one by one. Without standard deviation required,
+            its field is ``NaN``.
+
+        Notes
+        -----
+        - Intervals are aggregated by vectorized reductions over groups of
+          values of the same interval.
+        - The last interval stays open and is merged with next values.
+
+        """
+        values, mask = self._filter_batch(values)
+        stamps = np.asarray(timestamps, dtype=float).ravel()[mask]
+        values = values[mask]
+        summaries = []
+        if values.size:
+            index = np.floor(stamps / self._interval).astype(np.int64)
+            starts = np.concatenate(
+                ([0], np.flatnonzero(np.diff(index)) + 1))
+            ends = np.append(starts[1:], values.size)
+            counts = ends - starts
+            means = np.add.reduceat(values, starts) / counts
+            deviations = values - np.repeat(means, counts)
+            m2s = np.add.reduceat(deviations * deviations, starts)
+            mins = np.minimum.reduceat(values, starts)
+            maxs = np.maximum.reduceat(values, starts)
+            lasts = values[ends - 1]
+            groups = index[starts]
+            # Merge the first group with the current interval
+            if self._index is not None and groups[0] != self._index:
+                summaries.append(self.flush())
+            self._index = int(groups[0])
+            self._merge(int(counts[0]), float(mins[0]), float(maxs[0]),
+                        float(means[0]), float(m2s[0]), float(lasts[0]))
+            if groups.size > 1:
+                summaries.append(self.flush())
+                # Independent groups between first and last one
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    stds = np.sqrt(m2s / (counts - 1))
+                stds[counts < 2] = 0.0
+                middle = slice(1, groups.size - 1)
+                batch = np.empty(groups.size - 2, dtype=self.SUMMARY_DTYPE)
+                batch['start'] = groups[middle] * self._interval
+                batch['count'] = counts[middle]
+                batch['min'] = mins[middle]
+                batch['max'] = maxs[middle]
+                batch['mean'] = means[middle]
+                batch['last'] = lasts[middle]
+                batch['std'] = stds[middle] if self._std else np.nan
+                summaries.append(batch)
+                self._index = int(groups[-1])
+                self._merge(int(counts[-1]), float(mins[-1]),
+                            float(maxs[-1]), float(means[-1]),
+                            float(m2s[-1]), float(lasts[-1]))
+        result = []
+        for summary in summaries:
+            if isinstance(summary, IntervalSummary):
+                summary = np.array(
+                    [(summary.start, summary.count, summary.min, summary.max,
+                      summary.mean, summary.last,
+                      np.nan if summary.std is None else summary.std)],
+                    dtype=self.SUMMARY_DTYPE)
+            result.append(summary)
+        if not result:
+            return np.empty(0, dtype=self.SUMMARY_DTYPE)
+        return np.concatenate(result)
+
+
+###############################################################################
+# Kalman filtering
+###############################################################################
+class Kalman(StatFilter):
+    """One-dimensional Kalman filter smoothing.
+
+    Arguments
+    ---------
+    process_noise : float
+        Positive variance of the process noise per sample, i.e., how much the
+        true value (or its velocity) changes between samples.
+    measure_noise : float
+        Positive variance of the measurement noise of sample values.
+    velocity : bool
+        Flag about constant velocity model tracking the value with its rate
+        of change per sample. Otherwise the random walk model of the value
+        is used.
+
+    Notes
+    -----
+    - The ratio of process and measurement noise determines the smoothing.
+      The smaller it is, the stronger smoothing with greater lag.
+    - The random walk model with steady gain is equivalent to exponential
+      smoothing, but the gain is optimal for the noise variances and it is
+      greater at start up.
+    - The very first input value is considered as a starting estimate with
+      the measurement noise variance.
+
+    """
+
+    __slots__ = (
+        '_q', '_r', '_velocity', '_value', '_rate', '_p00', '_p01', '_p11',
+    )
+
+    PROCESS_NOISE_DEF = 1e-3
+    """float: Default variance of the process noise."""
+
+    MEASURE_NOISE_DEF = 1.0
+    """float: Default variance of the measurement noise."""
+
+    _SNAPSHOT_TAG = b'SFKF'
+    _SNAPSHOT_STATE = struct.Struct('<?ddddd')
+
+    def __init__(self,
+                 process_noise=PROCESS_NOISE_DEF,
+                 measure_noise=MEASURE_NOISE_DEF,
+                 velocity=False,
+                 ):
+        super().__init__()
+        self._q = _positive(process_noise, self.PROCESS_NOISE_DEF)
+        self._r = _positive(measure_noise, self.MEASURE_NOISE_DEF)
+        self._velocity = bool(velocity)
+        self.reset()
+        _logger.debug(
+            'Instance of %s created: %s',
+            self.__class__.__name__, str(self)
+            )
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        msg = \
+            f'KalmanSmoothing(' \
+            f'{self.process_noise}/' \
+            f'{self.measure_noise}' \
+            f'{"-V" if self.velocity else ""})'
+        return msg
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        msg = \
+            f'{self.__class__.__name__}(' \
+            f'process_noise={repr(self.process_noise)}, ' \
+            f'measure_noise={repr(self.measure_noise)}, ' \
+            f'velocity={repr(self.velocity)})'
+        return msg
+
+    @property
+    def process_noise(self):
+        """Variance of the process noise."""
+        return self._q
+
+    @property
+    def measure_noise(self):
+        """Variance of the measurement noise."""
+        return self._r
+
+    @property
+    def velocity(self):
+        """Flag about constant velocity model."""
+        return self._velocity
+
+    @property
+    def readings(self):
+        """Flag about existing estimate as a number."""
+        return int(self._value is not None)
+
+    @property
+    def rate(self):
+        """Estimated rate of change per sample in constant velocity model."""
+        return self._rate
+
+    def reset(self):
+        """Reset instance object to initial state."""
+        self._value = None
+        self._rate = 0.0
+        self._p00 = self._p01 = self._p11 = 0.0
+
+    def _dump(self, now):
+        """Return bytes of estimates and their covariance."""
+        return self._SNAPSHOT_STATE.pack(
+            self._value is not None, self._value or 0.0, self._rate,
+            self._p00, self._p01, self._p11)
+
+    def _load(self, data, now):
+        """Set estimates and their covariance."""
+        has_value, value, self._rate, self._p00, self._p01, self._p11 = \
+            self._SNAPSHOT_STATE.unpack_from(data)
+        self._value = value if has_value else None
+
+    def _update(self, value):
+        """Predict and correct the estimate by a new value."""
+        q = self._q
+        r = self._r
+        if self._value is None:
+            self._value = value
+            self._rate = 0.0
+            self._p00 = r
+            self._p01 = 0.0
+            self._p11 = r if self._velocity else 0.0
+            return
+        if self._velocity:
+            # Predict
+            self._value += self._rate
+            p01 = self._p01 + self._p11 + q / 2
+            p00 = self._p00 + 2 * self._p01 + self._p11 + q / 4
+            p11 = self._p11 + q
+            # Correct
+            gain0 = p00 / (p00 + r)
+            gain1 = p01 / (p00 + r)
+            innovation = value - self._value
+            self._value += gain0 * innovation
+            self._rate += gain1 * innovation
+            self._p00 = (1 - gain0) * p00
+            self._p01 = (1 - gain0) * p01
+            self._p11 = p11 - gain1 * p01
+        else:
+            p00 = self._p00 + q
+            gain = p00 / (p00 + r)
+            self._value += gain * (value - self._value)
+            self._p00 = (1 - gain) * p00
+
+    def result(self, value=None):
+        """Calculate statistically smoothed value.
+
+        Arguments
+        ---------
+        value : float
+            Sample value to be smoothed.
+
+        Returns
+        -------
+        float
+            If None input value is provided, recent estimate is returned,
+            otherwise the new estimate is.
+
+        """
+        value = super().result(value)
+        if value is not None:
+            self._update(value)
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    'Value %s, Statistic %s',
+                    value, self._value
+                    )
+        return self._value
+
+    def result_batch(self, values):
+        """Calculate smoothed values of an array of samples.
+
+        Arguments
+        ---------
+        values : array_like
+            One-dimensional array of sample values to be smoothed in order of
+            their arrival. Missing values are marked by ``NaN``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of results as the method `result` would return them for
+            input values one by one, with ``NaN`` instead of None.
+
+        Notes
+        -----
+        - Gains of the random walk model do not depend on values. They are
+          iterated until they converge to the steady gain and values are
+          smoothed by the vectorized recursive filter with those gains.
+        - Values of the constant velocity model are processed one by one.
+
+        """
+        values, mask = self._filter_batch(values)
+        previous = math.nan if self._value is None else self._value
+        samples = values[mask]
+        if not samples.size:
+            return _forward_fill(mask, samples, previous)
+        if self._velocity:
+            estimates = np.empty(samples.size)
+            for i, value in enumerate(samples.tolist()):
+                self._update(value)
+                estimates[i] = self._value
+            return _forward_fill(mask, estimates, previous)
+        start = previous
+        if self._value is None:
+            start = samples[0]
+            self._update(float(samples[0]))
+            first = 1
+        else:
+            first = 0
+        gains = np.ones(samples.size)
+        gain = math.nan
+        for i in range(first, samples.size):
+            p00 = self._p00 + self._q
+            next_gain = p00 / (p00 + self._r)
+            self._p00 = (1 - next_gain) * p00
+            if next_gain == gain:
+                gains[i:] = gain
+                break
+            gains[i] = gain = next_gain
+        estimates = _iir_batch(start, samples, 1.0 - gains)
+        self._value = float(estimates[-1])
+        return _forward_fill(mask, estimates, previous)
+
+
+class KalmanBank(object):
+    """One-dimensional Kalman filter smoothing of multiple channels at once.
+
+    Arguments
+    ---------
+    channels : int
+        Positive integer number of independent channels smoothed by the bank.
+    process_noise : float | array_like
+        Positive variance of the process noise for all channels or for each
+        of them.
+    measure_noise : float | array_like
+        Positive variance of the measurement noise for all channels or for
+        each of them.
+    velocity : bool
+        Flag about constant velocity model for all channels.
+
+    Notes
+    -----
+    - States of all channels are kept in arrays and updated by a vectorized
+      step from one vector of new readings.
+    - The bank requires the package ``numpy``.
+
+    See Also
+    --------
+    Kalman : Kalman filter smoothing of a single channel.
+
+    """
+
+    __slots__ = (
+        '_channels', '_q', '_r', '_velocity', '_value', '_rate', '_p00',
+        '_p01', '_p11',
+    )
+
+    def __init__(self,
+                 channels,
+                 process_noise=Kalman.PROCESS_NOISE_DEF,
+                 measure_noise=Kalman.MEASURE_NOISE_DEF,
+                 velocity=False,
+                 ):
+        """Create the class instance - constructor."""
+        _check_numpy()
+        self._channels = max(abs(int(channels)), 1)
+        shape = (self._channels,)
+        self._q = np.broadcast_to(
+            np.abs(np.asarray(process_noise, dtype=float)), shape).copy()
+        self._r = np.broadcast_to(
+            np.abs(np.asarray(measure_noise, dtype=float)), shape).copy()
+        self._velocity = bool(velocity)
+        self._value = np.full(shape, np.nan)
+        self._rate = np.zeros(shape)
+        self._p00 = np.zeros(shape)
+        self._p01 = np.zeros(shape)
+        self._p11 = np.zeros(shape)
+        _logger.debug(
+            'Instance of %s created: %s',
+            self.__class__.__name__, str(self)
+            )
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        msg = \
+            f'KalmanBank(' \
+            f'{self.channels}' \
+            f'{"-V" if self._velocity else ""})'
+        return msg
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        msg = \
+            f'{self.__class__.__name__}(' \
+            f'channels={repr(self.channels)}, ' \
+            f'velocity={repr(self._velocity)})'
+        return msg
+
+    @property
+    def channels(self):
+        """Number of smoothed channels."""
+        return self._channels
+
+    @property
+    def rate(self):
+        """Array of estimated rates of change per sample of channels."""
+        return self._rate.copy()
+
+    def reset(self, channel=None):
+        """Reset all channels or the provided one to initial state."""
+        if channel is None:
+            channel = slice(None)
+        self._value[channel] = np.nan
+        self._rate[channel] = 0.0
+        self._p00[channel] = 0.0
+        self._p01[channel] = 0.0
+        self._p11[channel] = 0.0
+
+    def result(self, values):
+        """Update estimates of all channels by new values.
+
+        Arguments
+        ---------
+        values : array_like
+            Vector of sample values for all channels. Missing values are
+            marked by ``NaN``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Vector of recent estimates of channels, ``NaN`` for channels
+            without any value yet.
+
+        """
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size != self._channels:
+            raise ValueError(
+                f'Expected {self._channels} values, got {values.size}')
+        valid = ~np.isnan(values)
+        start = valid & np.isnan(self._value)
+        rows = np.flatnonzero(valid & ~start)
+        if rows.size:
+            q = self._q[rows]
+            r = self._r[rows]
+            value = self._value[rows]
+            if self._velocity:
+                rate = self._rate[rows]
+                p00 = self._p00[rows]
+                p01 = self._p01[rows]
+                p11 = self._p11[rows]
+                value = value + rate
+                p00 = p00 + 2 * p01 + p11 + q / 4
+                p01 = p01 + p11 + q / 2
+                p11 = p11 + q
+                gain0 = p00 / (p00 + r)
+                gain1 = p01 / (p00 + r)
+                innovation = values[rows] - value
+                self._value[rows] = value + gain0 * innovation
+                self._rate[rows] = rate + gain1 * innovation
+                self._p00[rows] = (1 - gain0) * p00
+                self._p01[rows] = (1 - gain0) * p01
+                self._p11[rows] = p11 - gain1 * p01
+            else:
+                p00 = self._p00[rows] + q
+                gain = p00 / (p00 + r)
+                self._value[rows] = value + gain * (values[rows] - value)
+                self._p00[rows] = (1 - gain) * p00
+        # Start estimates of channels with first values
+        self._value[start] = values[start]
+        self._rate[start] = 0.0
+        self._p00[start] = self._r[start]
+        self._p01[start] = 0.0
+        self._p11[start] = self._r[start] if self._velocity else 0.0
+        return self._value.copy()
+
+
+###############################################################################
+# Convolution smoothing
+###############################################################################
+class Convolution(StatFilter):
+    """Finite impulse response smoothing by convolution with taps.
+
+    Arguments
+    ---------
+    taps : sequence of float
+        Coefficients applied to the window of recent samples ordered from the
+        oldest one to the newest one.
+
+    Notes
+    -----
+    - Recent samples are kept in the ring buffer of the length of taps.
+    - Until the window is filled up, it is padded with the very first value.
+    - Savitzky-Golay smoothing is created by the class method
+      `savitzky_golay`.
+
+    """
+
+    __slots__ = ('_taps', '_taps2', '_head', '_count', '_value')
+
+    _SNAPSHOT_TAG = b'SFCV'
+    _SNAPSHOT_STATE = struct.Struct('<III?d')
+
+    def __init__(self, taps):
+        super().__init__()
+        self._taps = array('d', taps)
+        if not self._taps:
+            raise ValueError('No convolution taps')
+        # Doubled taps aligned with the ring buffer by slicing
+        self._taps2 = self._taps + self._taps
+        self._buffer = array('d', bytes(8 * len(self._taps)))
+        self.reset()
+        _logger.debug(
+            'Instance of %s created: %s',
+            self.__class__.__name__, str(self)
+            )
+
+    @classmethod
+    def savitzky_golay(cls, window_len=5, order=2, deriv=0, pos=None):
+        """Create smoothing by Savitzky-Golay polynomial fit.
+
+        Arguments
+        ---------
+        See the function `savgol_taps`.
+
+        """
+        return cls(savgol_taps(window_len, order, deriv, pos))
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        msg = \
+            f'ConvolutionSmoothing(' \
+            f'{len(self._taps)})'
+        return msg
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        msg = \
+            f'{self.__class__.__name__}(' \
+            f'taps={repr(self.taps)})'
+        return msg
+
+    @property
+    def taps(self):
+        """Tuple of convolution coefficients."""
+        return tuple(self._taps)
+
+    @property
+    def readings(self):
+        """Number of samples in the window without padding."""
+        return self._count
+
+    def reset(self):
+        """Reset instance object to initial state."""
+        self._head = 0
+        self._count = 0
+        self._value = None
+
+    def _dump(self, now):
+        """Return bytes of the window and recent result."""
+        state = self._SNAPSHOT_STATE.pack(
+            len(self._taps), self._count, self._head,
+            self._value is not None, self._value or 0.0)
+        return state + _pack_array(self._buffer)
+
+    def _load(self, data, now):
+        """Set the window and recent result."""
+        taps_len, count, head, has_value, value = \
+            self._SNAPSHOT_STATE.unpack_from(data)
+        if taps_len != len(self._taps) or head >= taps_len:
+            raise ValueError('Snapshot of different taps')
+        buffer, _ = _unpack_array(data, self._SNAPSHOT_STATE.size, taps_len)
+        self._buffer = buffer
+        self._count = count
+        self._head = head
+        self._value = value if has_value else None
+
+    def _window(self):
+        """Return samples of the window ordered from the oldest one."""
+        return self._buffer[self._head:] + self._buffer[:self._head]
+
+    def result(self, value=None):
+        """Calculate statistically smoothed value.
+
+        Arguments
+        ---------
+        value : float
+            Sample value to be smoothed.
+
+        Returns
+        -------
+        float
+            If None input value is provided, recent result is returned,
+            otherwise the new convolution result is.
+
+        """
+        value = super().result(value)
+        if value is None:
+            return self._value
+        taps_len = len(self._taps)
+        if not self._count:
+            for i in range(taps_len):
+                self._buffer[i] = value
+        self._buffer[self._head] = value
+        self._head = (self._head + 1) % taps_len
+        self._count = min(self._count + 1, taps_len)
+        # The oldest sample is at the head, aligned with the first tap
+        shift = taps_len - self._head
+        self._value = math.fsum(map(
+            float.__mul__,
+            self._buffer,
+            self._taps2[shift:shift + taps_len]))
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                'Value %s, Statistic %s',
+                value, self._value
+                )
+        return self._value
+
+    def result_batch(self, values):
+        """Calculate smoothed values of an array of samples.
+
+        Arguments
+        ---------
+        values : array_like
+            One-dimensional array of sample values to be smoothed in order of
+            their arrival. Missing values are marked by ``NaN``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of results as the method `result` would return them for
+            input values one by one, with ``NaN`` instead of None.
+
+        Notes
+        -----
+        - The window is prepended to samples and all of them are convolved
+          with taps at once.
+
+        """
+        values, mask = self._filter_batch(values)
+        previous = math.nan if self._value is None else self._value
+        samples = values[mask]
+        if not samples.size:
+            return _forward_fill(mask, samples, previous)
+        taps_len = len(self._taps)
+        if self._count:
+            window = np.frombuffer(self._window(), dtype=float)
+        else:
+            window = np.full(taps_len, samples[0])
+        extended = np.concatenate((window, samples))
+        taps = np.frombuffer(self._taps, dtype=float)
+        results = np.convolve(extended, taps[::-1], 'valid')[1:]
+        self._buffer = array('d', extended[-taps_len:].tobytes())
+        self._head = 0
+        self._count = min(self._count + samples.size, taps_len)
+        self._value = float(results[-1])
+        return _forward_fill(mask, results, previous)
+
+
+###############################################################################
+# Replay of recorded logs
+###############################################################################
+def _parse_lines(lines, columns, delimiter):
+    """Convert columns of text lines to a two-dimensional float array.
+
+    Notes
+    -----
+    - Lines are parsed at once by numpy. If some of them contains a missing
+      or not numeric field, the chunk is parsed again line by line with
+      ``NaN`` for those fields.
+
+    """
+    try:
+        return np.loadtxt(lines, dtype=float, delimiter=delimiter,
+                          usecols=columns, ndmin=2, comments=None)
+    except (ValueError, IndexError):
+        pass
+    rows = []
+    for fields in csv.reader(lines, delimiter=delimiter):
+        if not fields:
+            continue
+        row = []
+        for column in columns:
+            try:
+                row.append(float(fields[column]))
+            except (IndexError, ValueError):
+                row.append(math.nan)
+        rows.append(row)
+    return np.array(rows, dtype=float).reshape(-1, len(columns))
+
+
+def read_log(file, column=1, timestamp_column=None, delimiter=',',
+             header=True, chunk_len=REPLAY_CHUNK_LEN):
+    """Read sample values of a CSV log file in chunks.
+
+    Arguments
+    ---------
+    file : str
+        Path to a CSV file with recorded samples.
+    column : int | str
+        Index of the column with sample values or its name in the header.
+    timestamp_column : int | str
+        Index or name of the column with numeric timestamps in seconds.
+        If none is provided, timestamps are not read.
+    delimiter : str
+        Separator of fields in lines.
+    header : bool
+        Flag about the first line with names of columns.
+    chunk_len : int
+        Maximal number of lines read at once.
+
+    Yields
+    ------
+    tuple
+        Array of sample values and array of their timestamps or None for each
+        chunk of lines. Missing and not numeric fields are ``NaN``.
+
+    Notes
+    -----
+    - Only one chunk is kept in memory, so that a log file of any size can be
+      read.
+
+    """
+    _check_numpy()
+    chunk_len = max(abs(int(chunk_len)), 1)
+    with open(file, newline='') as stream:
+        names = []
+        if header:
+            names = next(csv.reader([stream.readline()], delimiter=delimiter),
+                         [])
+        columns = [column]
+        if timestamp_column is not None:
+            columns.append(timestamp_column)
+        columns = [
+            names.index(name) if isinstance(name, str) else int(name)
+            for name in columns
+        ]
+        while True:
+            lines = list(itertools.islice(stream, chunk_len))
+            if not lines:
+                break
+            data = _parse_lines(lines, columns, delimiter)
+            yield data[:, 0], data[:, 1] if timestamp_column is not None \
+                else None
+
+
+def make_filter(config):
+    """Create a filter from its picklable configuration.
+
+    Arguments
+    ---------
+    config : tuple
+        Name of a filter class of this module and dictionary of keyword
+        arguments of its constructor. The keyword argument ``filter`` can
+        contain configuration of a value filter of a statistical filter.
+
+    Returns
+    -------
+    ValueFilter | StatFilter
+        New filter object.
+
+    """
+    name, kwargs = config
+    kwargs = dict(kwargs or {})
+    value_filter = kwargs.pop('filter', None)
+    cls = globals().get(name)
+    if not (isinstance(cls, type)
+            and issubclass(cls, (ValueFilter, StatFilter))):
+        raise ValueError(f'Unknown filter class {name}')
+    flt = cls(**kwargs)
+    if value_filter is not None:
+        flt.filter = make_filter(value_filter)
+    return flt
+
+
+def sweep_configs(name, **params):
+    """Create configurations of a filter for all combinations of parameters.
+
+    Arguments
+    ---------
+    name : str
+        Name of a filter class of this module.
+    params : dict
+        Sequence of values for each keyword argument of the filter
+        constructor.
+
+    Returns
+    -------
+    list of tuple
+        Configurations for the function `make_filter`.
+
+    Example
+    -------
+    ``sweep_configs('Running', buffer_len=(5, 9), def_stat=('AVG', 'MED'))``
+
+    """
+    keys = list(params)
+    return [
+        (name, dict(zip(keys, values)))
+        for values in itertools.product(*params.values())
+    ]
+
+
+def _replay_method(flt, timestamps):
+    """Return batch method of a filter for replaying and its timestamp flag.
+
+    Arguments
+    ---------
+    flt : ValueFilter | StatFilter
+        Filter replaying a log.
+    timestamps : bool
+        Flag about timestamps read from the log.
+
+    Returns
+    -------
+    tuple
+        Batch method of the filter and flag about passing timestamps to it.
+
+    Raises
+    ------
+    TypeError
+        The filter has no batch method or it requires timestamps, which are
+        not read from the log.
+
+    """
+    if isinstance(flt, ValueFilter):
+        return flt.filter_batch, False
+    method = getattr(flt, 'result_batch', None)
+    if method is None:
+        raise TypeError(f'Filter {flt} cannot be replayed without batch method')
+    parameter = inspect.signature(method).parameters.get('timestamps')
+    if parameter is None:
+        return method, False
+    if not timestamps and parameter.default is inspect.Parameter.empty:
+        raise TypeError(f'Filter {flt} cannot be replayed without timestamps')
+    return method, timestamps
+
+
+def replay_file(config, file, column=1, timestamp_column=None, **options):
+    """Run a filter over sample values of a CSV log file.
+
+    Arguments
+    ---------
+    config : tuple
+        Configuration of the filter for the function `make_filter`.
+    file : str
+        Path to a CSV file with recorded samples.
+    column : int | str
+        Index of the column with sample values or its name in the header.
+    timestamp_column : int | str
+        Index or name of the column with numeric timestamps in seconds passed
+        to the filter.
+    options : dict
+        Other keyword arguments of the function `read_log`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Results of batch method of the filter for all samples. For a
+        ``Decimator`` it is the structured array of summaries including the
+        last interval.
+
+    Raises
+    ------
+    TypeError
+        The filter has no batch method, e.g., ``Quantile``, or it requires
+        timestamps, e.g., ``Decimator``, and no timestamp column is provided.
+
+    Notes
+    -----
+    - Timestamps are passed only to filters, whose batch method accepts
+      them.
+
+    """
+    flt = make_filter(config)
+    method, stamped = _replay_method(flt, timestamp_column is not None)
+    results = []
+    for values, stamps in read_log(file, column, timestamp_column,
+                                   **options):
+        if stamped:
+            results.append(method(values, timestamps=stamps))
+        else:
+            results.append(method(values))
+    if isinstance(flt, Decimator):
+        summary = flt.flush()
+        if summary is not None:
+            results.append(np.array(
+                [(summary.start, summary.count, summary.min, summary.max,
+                  summary.mean, summary.last,
+                  np.nan if summary.std is None else summary.std)],
+                dtype=Decimator.SUMMARY_DTYPE))
+        if not results:
+            return np.empty(0, dtype=Decimator.SUMMARY_DTYPE)
+    elif not results:
+        return np.empty(0)
+    return np.concatenate(results)
+
+
+def replay(configs, files, workers=None, **options):
+    """Run filters over CSV log files in parallel processes.
+
+    Arguments
+    ---------
+    configs : list of tuple
+        Configurations of filters for the function `make_filter`, e.g.,
+        from the function `sweep_configs`.
+    files : list of str
+        Paths to CSV files with recorded samples.
+    workers : int
+        Maximal number of processes. If none is provided, the number of
+        processors is used.
+    options : dict
+        Keyword arguments of the function `replay_file`.
+
+    Returns
+    -------
+    list of list
+        Arrays of results for each configuration and each file in their
+        order, i.e., ``results[config][file]``.
+
+    Raises
+    ------
+    TypeError
+        Some filter cannot be replayed. All configurations are checked before
+        any task is submitted.
+
+    Notes
+    -----
+    - Each combination of a configuration and a file is replayed in a
+      separate task by a new filter, so that a file is read once per
+      configuration.
+
+    """
+    _check_numpy()
+    timestamps = options.get('timestamp_column') is not None
+    for config in configs:
+        _replay_method(make_filter(config), timestamps)
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        futures = [
+            [executor.submit(replay_file, config, file, **options)
+             for file in files]
+            for config in configs
+        ]
+        return [[future.result() for future in row] for row in futures]
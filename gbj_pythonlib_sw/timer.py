@@ -5,7 +5,7 @@ A prescaler can be considered as a timer period divider and can run its own
 callbacks separately from the timer's callbacks.
 
 """
-__version__ = '0.4.0'
+__version__ = '0.5.0'
 __status__ = 'Beta'
 __author__ = 'Libor Gabaj'
 __copyright__ = 'Copyright 2018-2019, ' + __author__
@@ -17,14 +17,29 @@ __email__ = 'libor.gabaj@gmail.com'
 
 import threading
 import logging
+import asyncio
+import collections
+import heapq
+import inspect
+import math
+import time
 
 
 ###############################################################################
 # Variables
 ###############################################################################
+_logger = logging.getLogger(' '.join([__name__, __version__]))
+"""logging.Logger: Logger shared by all instances of the module's classes."""
+
 timers = {}
 """dict: Registration storage of timers."""
 
+_scheduler = None
+"""object: Scheduler used by timers without their own backend."""
+
+_schedulers = {}
+"""dict: Shared schedulers of backends by their names."""
+
 
 ###############################################################################
 # Functions
@@ -58,6 +73,49 @@ def unregister(name):
         pass
 
 
+def set_backend(backend):
+    """Set the scheduler backend of timers without their own backend.
+
+    Arguments
+    ---------
+    backend : str | object
+        Name of a backend from the dictionary ``BACKENDS`` or a scheduler
+        object. The scheduler is used at next start of a timer. Timers of
+        the same backend name share one scheduler.
+        - ``thread``: Each timer period runs in a new thread, as the
+          ``threading.Timer`` does. It is the default backend.
+        - ``heap``: All timers are dispatched by one thread from a heap of
+          their deadlines.
+        - ``asyncio``: All timers are dispatched by the running asyncio event
+          loop and coroutine callbacks run as its tasks.
+        - ``wheel``: All timers are dispatched by one thread from a
+          hierarchical timing wheel with O(1) start and cancel.
+
+    """
+    global _scheduler
+    _scheduler = _create_backend(backend)
+
+
+def get_backend():
+    """Return the scheduler of timers without their own backend."""
+    if _scheduler is None:
+        set_backend(BACKEND_DEF)
+    return _scheduler
+
+
+def _create_backend(backend):
+    """Return shared scheduler for a backend name or the scheduler itself."""
+    if not isinstance(backend, str):
+        return backend
+    backend = backend.lower()
+    if backend not in _schedulers:
+        try:
+            _schedulers[backend] = BACKENDS[backend]()
+        except KeyError:
+            raise ValueError(f'Unknown timer backend {backend}')
+    return _schedulers[backend]
+
+
 def start_all():
     """Start all registered timers."""
     for timer in timers:
@@ -70,9 +128,591 @@ def stop_all():
         timers[timer].stop()
 
 
+###############################################################################
+# Schedulers
+###############################################################################
+async def _awaited(awaitable):
+    """Await an awaitable object as a coroutine."""
+    return await awaitable
+
+
+def _invoke(callback, args, kwargs):
+    """Call callback in an executor and run awaitable object returned by it.
+
+    Notes
+    -----
+    - The function is module level one, so that it can be pickled for
+      a process pool executor together with the callback and its arguments.
+
+    """
+    result = callback(*args, **kwargs)
+    if inspect.isawaitable(result):
+        asyncio.run(_awaited(result))
+
+
+class Scheduler(object):
+    """Common management of scheduling timer callbacks."""
+
+    __slots__ = ()
+
+    def call_at(self, deadline, func, name=None):
+        """Plan calling function at monotonic time.
+
+        Arguments
+        ---------
+        deadline : float
+            Time of the ``time.monotonic`` clock in seconds.
+        func : function
+            Function without arguments.
+        name : str
+            Name of the planned call.
+
+        Returns
+        -------
+        object
+            Object of the planned call with method `cancel`.
+
+        """
+        raise NotImplementedError
+
+    def spawn(self, awaitable, name=None):
+        """Run awaitable object returned by a callback.
+
+        Notes
+        -----
+        - Outside of an event loop the awaitable is run to completion in
+          a new event loop of the calling thread.
+
+        """
+        asyncio.run(_awaited(awaitable))
+
+
+class ThreadScheduler(Scheduler):
+    """Scheduling callbacks each in its own thread by ``threading.Timer``."""
+
+    __slots__ = ()
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        return 'ThreadScheduler()'
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        return f'{self.__class__.__name__}()'
+
+    def call_at(self, deadline, func, name=None):
+        """Run function at monotonic time in a new thread.
+
+        Arguments
+        ---------
+        deadline : float
+            Time of the ``time.monotonic`` clock in seconds.
+        func : function
+            Function without arguments.
+        name : str
+            Name of the thread.
+
+        Returns
+        -------
+        threading.Timer
+            Started thread object with method `cancel`.
+
+        """
+        handle = threading.Timer(max(deadline - time.monotonic(), 0.0), func)
+        if name is not None:
+            handle.name = name
+        handle.start()
+        return handle
+
+
+class Handle(object):
+    """Scheduled call of a function, which can be cancelled.
+
+    Arguments
+    ---------
+    scheduler : object
+        Scheduler, which has planned the call.
+    deadline : float
+        Monotonic time of the call in seconds.
+    func : function
+        Function without arguments. It is None after the call or
+        cancelling.
+
+    """
+
+    __slots__ = ('scheduler', 'deadline', 'func')
+
+    def __init__(self, scheduler, deadline, func):
+        """Create the class instance - constructor."""
+        self.scheduler = scheduler
+        self.deadline = deadline
+        self.func = func
+
+    def __lt__(self, other):
+        """Compare handles by their deadlines."""
+        return self.deadline < other.deadline
+
+    def cancel(self):
+        """Cancel the call, if it has not been run yet."""
+        self.scheduler.cancel(self)
+
+
+class HeapScheduler(Scheduler):
+    """Scheduling callbacks by one dispatcher thread from a heap of deadlines.
+
+    Notes
+    -----
+    - The dispatcher thread is started at the first scheduled call and
+      waits for the earliest deadline, so that no thread is created per call.
+    - Cancelled calls stay in the heap and are dropped when they expire.
+      The heap is rebuilt, if cancelled calls prevail.
+    - Functions are called one after another in the dispatcher thread, so
+      that a slow callback delays other timers.
+
+    """
+
+    __slots__ = ('_heap', '_condition', '_thread', '_cancelled')
+
+    COMPACT_MIN = 64
+    """int: Minimal number of cancelled calls for rebuilding the heap."""
+
+    def __init__(self):
+        """Create the class instance - constructor."""
+        self._heap = []
+        self._condition = threading.Condition()
+        self._thread = None
+        self._cancelled = 0
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        return f'HeapScheduler({len(self._heap)})'
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        return f'{self.__class__.__name__}()'
+
+    def __len__(self):
+        """Return number of pending calls."""
+        return len(self._heap) - self._cancelled
+
+    def call_at(self, deadline, func, name=None):
+        """Plan calling function at monotonic time in the dispatcher thread.
+
+        Arguments
+        ---------
+        deadline : float
+            Time of the ``time.monotonic`` clock in seconds.
+        func : function
+            Function without arguments.
+        name : str
+            Not used, for compatibility with other schedulers.
+
+        Returns
+        -------
+        Handle
+            Object of the planned call with method `cancel`.
+
+        """
+        handle = Handle(self, deadline, func)
+        with self._condition:
+            heapq.heappush(self._heap, handle)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._dispatch, name='TimerScheduler', daemon=True)
+                self._thread.start()
+            elif self._heap[0] is handle:
+                self._condition.notify()
+        return handle
+
+    def cancel(self, handle):
+        """Cancel planned call lazily."""
+        with self._condition:
+            if handle.func is None:
+                return
+            handle.func = None
+            self._cancelled += 1
+            if self._cancelled >= self.COMPACT_MIN \
+                    and 2 * self._cancelled > len(self._heap):
+                self._heap = [h for h in self._heap if h.func is not None]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def _dispatch(self):
+        """Call functions at their deadlines in a loop."""
+        while True:
+            with self._condition:
+                while True:
+                    heap = self._heap
+                    if not heap:
+                        self._condition.wait()
+                        continue
+                    handle = heap[0]
+                    if handle.func is None:
+                        heapq.heappop(heap)
+                        self._cancelled -= 1
+                        continue
+                    delay = handle.deadline - time.monotonic()
+                    if delay > 0:
+                        self._condition.wait(delay)
+                        continue
+                    heapq.heappop(heap)
+                    func = handle.func
+                    handle.func = None
+                    break
+            try:
+                func()
+            except Exception:
+                _logger.error('Scheduled call failed:', exc_info=True)
+
+
+class AsyncioScheduler(Scheduler):
+    """Scheduling callbacks by an asyncio event loop.
+
+    Arguments
+    ---------
+    loop : asyncio.AbstractEventLoop
+        Event loop calling callbacks. If none is provided, the loop running
+        at scheduling is used.
+
+    Notes
+    -----
+    - Callbacks are called by ``loop.call_at`` in the thread of the loop
+      without any other thread, so that timers should be started and
+      stopped from that thread.
+    - Awaitable objects returned by callbacks, e.g., by coroutine functions,
+      run as tasks of the loop, so that they do not block other timers.
+
+    """
+
+    __slots__ = ('_loop', '_tasks')
+
+    def __init__(self, loop=None):
+        """Create the class instance - constructor."""
+        self._loop = loop
+        self._tasks = set()
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        return f'AsyncioScheduler({len(self._tasks)})'
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        return f'{self.__class__.__name__}(loop={repr(self._loop)})'
+
+    @property
+    def loop(self):
+        """Event loop calling callbacks."""
+        return self._loop or asyncio.get_running_loop()
+
+    def call_at(self, deadline, func, name=None):
+        """Plan calling function at monotonic time by the event loop.
+
+        Arguments
+        ---------
+        deadline : float
+            Time of the ``time.monotonic`` clock in seconds.
+        func : function
+            Function without arguments.
+        name : str
+            Not used, for compatibility with other schedulers.
+
+        Returns
+        -------
+        asyncio.TimerHandle
+            Object of the planned call with method `cancel`.
+
+        """
+        loop = self.loop
+        return loop.call_at(deadline - time.monotonic() + loop.time(), func)
+
+    def spawn(self, awaitable, name=None):
+        """Run awaitable object returned by a callback as a task."""
+        task = self.loop.create_task(_awaited(awaitable), name=name)
+        # Keep reference to the task until it is done
+        self._tasks.add(task)
+        task.add_done_callback(self._done)
+
+    def _done(self, task):
+        """Forget finished task and log its failure."""
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            _logger.error('Task %s failed:', task.get_name(),
+                          exc_info=task.exception())
+
+
+class WheelHandle(Handle):
+    """Scheduled call of a function in a timing wheel.
+
+    Arguments
+    ---------
+    tick : int
+        Index of the wheel tick, at which the call is due.
+    bucket : set
+        Slot of the wheel containing the handle.
+
+    """
+
+    __slots__ = ('tick', 'bucket')
+
+    def __init__(self, scheduler, deadline, func, tick):
+        """Create the class instance - constructor."""
+        self.scheduler = scheduler
+        self.deadline = deadline
+        self.func = func
+        self.tick = tick
+        self.bucket = None
+
+
+class WheelScheduler(Scheduler):
+    """Scheduling callbacks by a hierarchical hashed timing wheel.
+
+    Arguments
+    ---------
+    tick : float
+        Positive resolution of deadlines in seconds. Calls are never run
+        before their deadline, but up to one tick after it.
+    slots : int
+        Number of slots of each wheel level.
+    levels : int
+        Number of wheel levels. A slot of a level spans all slots of
+        the level below it. Calls beyond the span of the top level are
+        put to its last slot and moved down later.
+
+    Notes
+    -----
+    - Planning and cancelling a call is O(1), because it only adds to or
+      removes from a set of a wheel slot.
+    - One dispatcher thread advances the wheel by ticks. Calls of a slot of
+      a higher level are moved down to lower levels, when the wheel reaches
+      the slot.
+    - Functions are called one after another in the dispatcher thread, so
+      that a slow callback delays other timers.
+    - Ticks elapsed while no call is planned are skipped at planning
+      the next call instead of being advanced one by one.
+
+    """
+
+    __slots__ = (
+        '_tick', '_slots', '_levels', '_wheels', '_origin', '_current',
+        '_count', '_condition', '_thread',
+    )
+
+    TICK_DEF = 0.01
+    """float: Default resolution of deadlines in seconds."""
+
+    SLOTS_DEF = 256
+    """int: Default number of slots of each wheel level."""
+
+    LEVELS_DEF = 4
+    """int: Default number of wheel levels."""
+
+    def __init__(self, tick=TICK_DEF, slots=SLOTS_DEF, levels=LEVELS_DEF):
+        """Create the class instance - constructor."""
+        self._tick = abs(float(tick)) or self.TICK_DEF
+        self._slots = max(abs(int(slots)), 2)
+        self._levels = max(abs(int(levels)), 1)
+        self._wheels = [
+            [set() for _ in range(self._slots)] for _ in range(self._levels)
+        ]
+        self._origin = time.monotonic()
+        self._current = 0
+        self._count = 0
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def __str__(self):
+        """Represent instance object as a string."""
+        return f'WheelScheduler({self._count})'
+
+    def __repr__(self):
+        """Represent instance object officially."""
+        msg = \
+            f'{self.__class__.__name__}(' \
+            f'tick={repr(self._tick)}, ' \
+            f'slots={repr(self._slots)}, ' \
+            f'levels={repr(self._levels)})'
+        return msg
+
+    def __len__(self):
+        """Return number of pending calls."""
+        return self._count
+
+    @property
+    def tick(self):
+        """Resolution of deadlines in seconds."""
+        return self._tick
+
+    def _insert(self, handle):
+        """Put handle to the slot of its tick relative to the current one."""
+        delta = handle.tick - self._current
+        span = self._slots
+        if delta < span:
+            bucket = self._wheels[0][handle.tick % span]
+            bucket.add(handle)
+            handle.bucket = bucket
+            return
+        level = 0
+        while delta >= span and level < self._levels - 1:
+            span *= self._slots
+            level += 1
+        # Width of a slot of the level in ticks
+        width = span // self._slots
+        tick = min(handle.tick, self._current + span - width)
+        bucket = self._wheels[level][tick // width % self._slots]
+        bucket.add(handle)
+        handle.bucket = bucket
+
+    def call_at(self, deadline, func, name=None):
+        """Plan calling function at monotonic time in the dispatcher thread.
+
+        Arguments
+        ---------
+        deadline : float
+            Time of the ``time.monotonic`` clock in seconds.
+        func : function
+            Function without arguments.
+        name : str
+            Not used, for compatibility with other schedulers.
+
+        Returns
+        -------
+        WheelHandle
+            Object of the planned call with method `cancel`.
+
+        """
+        tick = math.ceil((deadline - self._origin) / self._tick)
+        with self._condition:
+            if not self._count:
+                # Skip ticks elapsed while the wheel was empty, so that
+                # the dispatcher does not replay them, as all slots are empty
+                elapsed = math.floor(
+                    (time.monotonic() - self._origin) / self._tick)
+                self._current = max(self._current, elapsed)
+            handle = WheelHandle(
+                self, deadline, func, max(tick, self._current + 1))
+            self._insert(handle)
+            self._count += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._dispatch, name='TimerWheel', daemon=True)
+                self._thread.start()
+            elif self._count == 1:
+                self._condition.notify()
+        return handle
+
+    def cancel(self, handle):
+        """Cancel planned call by removing it from its slot."""
+        with self._condition:
+            if handle.func is None:
+                return
+            handle.func = None
+            handle.bucket.discard(handle)
+            handle.bucket = None
+            self._count -= 1
+
+    def _advance(self, due):
+        """Move the wheel by one tick and collect calls due at it."""
+        self._current += 1
+        current = self._current
+        # Move calls of reached slots of higher levels down
+        width = self._slots ** (self._levels - 1)
+        for level in range(self._levels - 1, 0, -1):
+            if current % width == 0:
+                bucket = self._wheels[level][current // width % self._slots]
+                handles = list(bucket)
+                bucket.clear()
+                for handle in handles:
+                    self._insert(handle)
+            width //= self._slots
+        bucket = self._wheels[0][current % self._slots]
+        for handle in list(bucket):
+            if handle.tick <= current:
+                bucket.discard(handle)
+                handle.bucket = None
+                due.append(handle)
+                self._count -= 1
+
+    def _dispatch(self):
+        """Advance the wheel in time and call due functions in a loop."""
+        while True:
+            due = []
+            with self._condition:
+                while not due:
+                    if not self._count:
+                        self._condition.wait()
+                        continue
+                    elapsed = time.monotonic() - self._origin
+                    target = math.floor(elapsed / self._tick)
+                    if target <= self._current:
+                        self._condition.wait(
+                            (self._current + 1) * self._tick - elapsed)
+                        continue
+                    while self._current < target:
+                        self._advance(due)
+                funcs = []
+                for handle in sorted(due):
+                    funcs.append(handle.func)
+                    handle.func = None
+            for func in funcs:
+                try:
+                    func()
+                except Exception:
+                    _logger.error('Scheduled call failed:', exc_info=True)
+
+
+BACKENDS = {
+    'thread': ThreadScheduler,
+    'heap': HeapScheduler,
+    'asyncio': AsyncioScheduler,
+    'wheel': WheelScheduler,
+}
+"""dict: Scheduler classes of timers by backend names."""
+
+BACKEND_DEF = 'thread'
+"""str: Name of the default scheduler backend."""
+
+
 ###############################################################################
 # Classes
 ###############################################################################
+class Offload(object):
+    """State of runs of a timer offloaded to an executor.
+
+    Arguments
+    ---------
+    executor : concurrent.futures.Executor
+        Executor running callbacks of the timer.
+    max_in_flight : int
+        Maximal number of runs submitted to the executor and not finished yet.
+    overflow : str
+        Policy of a run over the limit in flight.
+    max_queued : int
+        Maximal number of queued runs.
+
+    Notes
+    -----
+    - The state is created only for timers with an executor, so that
+      other timers do not allocate it.
+
+    """
+
+    __slots__ = (
+        'executor', 'max_in_flight', 'overflow', 'max_queued', 'in_flight',
+        'skipped', 'queue', 'lock',
+    )
+
+    def __init__(self, executor, max_in_flight, overflow, max_queued):
+        """Create the class instance - constructor."""
+        self.executor = executor
+        self.max_in_flight = max_in_flight
+        self.overflow = overflow
+        self.max_queued = max_queued
+        self.in_flight = 0
+        self.skipped = 0
+        self.queue = collections.deque()
+        self.lock = threading.Lock()
+
+
 class Timer(object):
     """Creating and registering a timer.
 
@@ -95,6 +735,44 @@ class Timer(object):
     name : str
         Name of the timer incorporated to its object. If none is provided,
         the concatenation of its class name and order is used.
+    backend : str | object
+        Name of a scheduler backend or a scheduler object used by the timer.
+        If none is provided, the module one set by `set_backend` is used.
+    drift_free : bool
+        Flag about scheduling runs at deadlines ``start + n * period`` on
+        the monotonic clock. Otherwise the next period starts after running
+        callbacks, so that the timer drifts by their duration.
+    overrun : str
+        Policy of a drift-free timer, if its callbacks run past the next
+        deadline. The argument is defined by one of following class's
+        constants
+        - ``SKIP``: Passed deadlines are skipped and the timer continues at
+          the next future one.
+        - ``COALESCE``: Passed deadlines are merged into one run started
+          immediately, then the timer continues at the next future one.
+        - ``CATCHUP``: Runs of passed deadlines are started one after
+          another immediately until the timer catches up with them.
+        Default policy is the first one in mentioned list of constants.
+    executor : concurrent.futures.Executor
+        Executor running callbacks instead of the scheduler, e.g., a shared
+        ``ThreadPoolExecutor`` or a ``ProcessPoolExecutor`` for CPU heavy
+        callbacks. Callbacks for a process pool have to be picklable.
+    max_in_flight : int
+        Positive maximal number of runs of the timer submitted to the
+        executor and not finished yet. Default is 1.
+    overflow : str
+        Policy of a run, when the timer has the maximal number of runs
+        in flight. The argument is defined by one of following class's
+        constants
+        - ``SKIP``: The run is skipped and counted by the property
+          `skipped`.
+        - ``QUEUE``: The run is queued and submitted, when a run in flight
+          finishes. If the queue is full, the run is skipped and counted
+          by the property `skipped`.
+        Default policy is the first one in mentioned list of constants.
+    max_queued : int
+        Positive maximal number of queued runs of the timer for the overflow
+        policy ``QUEUE``. Default is the maximal number of runs in flight.
 
     Notes
     -----
@@ -107,6 +785,12 @@ class Timer(object):
     - If the timer is created with count equal 1, it is an one-shot timer
       marked with ``O`` as ``oneshot`` in the string instance representation.
     - Keyword arguments not listed here are passed to the callback function(s).
+    - The number of runs of a drift-free timer not started because of
+      overruns is available as the property `missed`.
+    - State of offloading to an executor is allocated only for timers with
+      an executor.
+    - Stopping the timer discards its queued runs, while runs in flight
+      finish in the executor.
 
     See Also
     --------
@@ -114,6 +798,19 @@ class Timer(object):
 
     """
 
+    __slots__ = (
+        '_args', '_kwargs', '_period', '_callbacks', '_order', '_count',
+        '__name', '_prescalers', '_timer', '_stopping', '_repeate', '_mark',
+        '_backend', '_drift_free', '_overrun', '_start', '_ticks', '_missed',
+        '_offloading',
+    )
+
+    OVERRUN = ['SKIP', 'COALESCE', 'CATCHUP']
+    """list of str: Available overrun policies of drift-free timers."""
+
+    OVERFLOW = ['SKIP', 'QUEUE']
+    """list of str: Available policies of runs over the limit in flight."""
+
     _instances = 0
     """int: Number of class instances."""
 
@@ -133,6 +830,29 @@ class Timer(object):
         self._count = self._kwargs.pop('count', None)
         self.__name = self._kwargs.pop('name',
             f'{self.__class__.__name__}{self._order}')
+        backend = self._kwargs.pop('backend', None)
+        self._backend = None if backend is None else _create_backend(backend)
+        self._drift_free = bool(self._kwargs.pop('drift_free', False))
+        overrun = str(self._kwargs.pop('overrun', self.OVERRUN[0])).upper()
+        # Share the policy string of the class instead of a copy
+        self._overrun = self.OVERRUN[
+            self.OVERRUN.index(overrun) if overrun in self.OVERRUN else 0]
+        self._start = None
+        self._ticks = 0
+        self._missed = 0
+        executor = self._kwargs.pop('executor', None)
+        max_in_flight = max(
+            abs(int(self._kwargs.pop('max_in_flight', 1) or 1)), 1)
+        overflow = str(self._kwargs.pop('overflow', self.OVERFLOW[0])).upper()
+        if overflow not in self.OVERFLOW:
+            overflow = self.OVERFLOW[0]
+        max_queued = max(
+            abs(int(self._kwargs.pop('max_queued', max_in_flight)
+                    or max_in_flight)), 1)
+        self._offloading = None
+        if executor is not None:
+            self._offloading = Offload(
+                executor, max_in_flight, overflow, max_queued)
         #
         self._prescalers = []
         self._timer = None
@@ -150,11 +870,9 @@ class Timer(object):
                 self._repeate = False   # Flag about on-shot timer
         # Register timer
         register(self)
-        # Logging
-        self._logger = logging.getLogger(' '.join([__name__, __version__]))
-        self._logger.debug(
+        _logger.debug(
             'Instance of %s created: %s',
-            self.__class__.__name__, str(self)
+            self.__class__.__name__, self
         )
 
     def __del__(self):
@@ -162,8 +880,8 @@ class Timer(object):
 
         Notes
         -----
-        - In this method the object self._logger does not already exist,
-          so that logging is not possible.
+        - In this method the module logger might not already exist at
+          interpreter shutdown, so that logging is not possible.
 
         """
         type(self)._instances -= 1
@@ -211,12 +929,150 @@ class Timer(object):
         if hasattr(self, '_prescalers'):
             return self._prescalers
 
+    @property
+    def drift_free(self):
+        """Flag about scheduling at deadlines anchored to the start."""
+        return self._drift_free
+
+    @property
+    def overrun(self):
+        """Overrun policy of the drift-free timer."""
+        return self._overrun
+
+    @property
+    def missed(self):
+        """Number of runs not started because of overruns."""
+        return self._missed
+
+    @property
+    def executor(self):
+        """Executor running callbacks or None."""
+        if self._offloading is not None:
+            return self._offloading.executor
+
+    @property
+    def in_flight(self):
+        """Number of runs submitted to the executor and not finished."""
+        if self._offloading is None:
+            return 0
+        return self._offloading.in_flight
+
+    @property
+    def skipped(self):
+        """Number of runs skipped because of the limit in flight."""
+        if self._offloading is None:
+            return 0
+        return self._offloading.skipped
+
+    @property
+    def backend(self):
+        """Scheduler of the timer."""
+        if self._backend is None:
+            return get_backend()
+        return self._backend
+
     def _create_timer(self):
-        """Create new timer object and start it."""
+        """Schedule next run of callbacks by the scheduler."""
         if not self._stopping:
-            self._timer = threading.Timer(self._period, self._run_callback)
-            self._timer.name = self.__name
-            self._timer.start()
+            self._timer = self.backend.call_at(
+                self._deadline(),
+                self._run_callback,
+                self.__name)
+
+    def _deadline(self):
+        """Return monotonic time of the next run of callbacks."""
+        now = time.monotonic()
+        if not self._drift_free:
+            return now + self._period
+        self._ticks += 1
+        deadline = self._start + self._ticks * self._period
+        if deadline > now or self._overrun == 'CATCHUP':
+            return deadline
+        # Index of the last passed deadline
+        ticks = math.floor((now - self._start) / self._period)
+        late = ticks - self._ticks + 1
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug('%s overran %d deadlines', str(self), late)
+        if self._overrun == 'SKIP':
+            self._missed += late
+            self._ticks = ticks + 1
+            return self._start + self._ticks * self._period
+        # Coalesce late runs into one immediate run
+        self._missed += late - 1
+        self._ticks = ticks
+        return now
+
+    def _call(self, callback, args, kwargs):
+        """Call callback and run awaitable object returned by it."""
+        result = callback(*args, exec_last=not self._repeate, **kwargs)
+        if inspect.isawaitable(result):
+            self.backend.spawn(result, self.__name)
+
+    def _expired_prescalers(self):
+        """Count down prescalers and yield expired ones."""
+        for prescaler in self._prescalers:
+            prescaler['counter'] -= 1
+            if prescaler['counter'] <= 0:
+                prescaler['counter'] = prescaler['factor']
+                yield prescaler
+
+    def _offload(self):
+        """Submit callbacks of a run to the executor within the limit."""
+        calls = [(callback, self._args, self._kwargs)
+                 for callback in self._callbacks]
+        for prescaler in self._expired_prescalers():
+            calls.extend(
+                (callback, prescaler['args'], prescaler['kwargs'])
+                for callback in prescaler['callbacks'])
+        if not calls:
+            return
+        exec_last = not self._repeate
+        offloading = self._offloading
+        with offloading.lock:
+            if offloading.in_flight >= offloading.max_in_flight:
+                if offloading.overflow == 'QUEUE' \
+                        and len(offloading.queue) < offloading.max_queued:
+                    offloading.queue.append((calls, exec_last))
+                else:
+                    offloading.skipped += 1
+                    if _logger.isEnabledFor(logging.DEBUG):
+                        _logger.debug('Run of %s skipped', str(self))
+                return
+            offloading.in_flight += 1
+        self._submit(calls, exec_last)
+
+    def _submit(self, calls, exec_last):
+        """Submit callbacks of a run and the next queued run after it."""
+        offloading = self._offloading
+        remaining = [len(calls)]
+
+        def _done(future=None):
+            if future is not None and future.exception() is not None:
+                _logger.error('Running callbacks of %s failed:',
+                              str(self), exc_info=future.exception())
+            with offloading.lock:
+                remaining[0] -= 1
+                if remaining[0] > 0:
+                    return
+                if self._stopping:
+                    offloading.queue.clear()
+                if offloading.queue:
+                    run = offloading.queue.popleft()
+                else:
+                    offloading.in_flight -= 1
+                    return
+            self._submit(*run)
+
+        for callback, args, kwargs in calls:
+            try:
+                future = offloading.executor.submit(
+                    _invoke, callback, args, dict(kwargs, exec_last=exec_last))
+            except Exception:
+                _logger.error('Submitting callback %s of %s failed:',
+                              callback.__name__, str(self), exc_info=True)
+                _done()
+            else:
+                future.add_done_callback(_done)
 
     def _run_callback(self):
         """Run external instance callback.
@@ -235,37 +1091,36 @@ class Timer(object):
                 return
             if self._count == 1:
                 self._repeate = False
+        debug = _logger.isEnabledFor(logging.DEBUG)
         try:
+            if self._offloading is not None:
+                self._offload()
+                return
             # Call basic timer callback
             for callback in self._callbacks:
-                self._logger.debug(
-                    'Main callback %s of %s launched',
-                    callback.__name__, str(self)
-                )
-                callback(
-                    *self._args,
-                    exec_last=not self._repeate,
-                    **self._kwargs
-                )
+                if debug:
+                    _logger.debug(
+                        'Main callback %s of %s launched',
+                        callback.__name__, str(self)
+                    )
+                self._call(callback, self._args, self._kwargs)
             # Count down prescalers and call callbacks of expired ones
-            for prescaler in self._prescalers:
-                prescaler['counter'] -= 1
-                if prescaler['counter'] <= 0:
-                    prescaler['counter'] = prescaler['factor']
-                    callbacks = prescaler['callbacks']
-                    for callback in callbacks:
-                        self._logger.debug(
+            for prescaler in self._expired_prescalers():
+                callbacks = prescaler['callbacks']
+                for callback in callbacks:
+                    if debug:
+                        _logger.debug(
                             'Prescaler %d callback %s of %s launched',
                             prescaler['factor'],
                             callback.__name__, str(self)
                         )
-                        callback(
-                            *prescaler['args'],
-                            exec_last=not self._repeate,
-                            **prescaler['kwargs']
-                        )
+                    self._call(
+                        callback,
+                        prescaler['args'],
+                        prescaler['kwargs']
+                    )
         except Exception:
-            self._logger.error('Running callbacks of %s failed:',
+            _logger.error('Running callbacks of %s failed:',
                                str(self), exc_info=True)
         finally:
             if self._repeate:
@@ -274,20 +1129,25 @@ class Timer(object):
                     self._count -= 1
 
     def start(self):
-        """Create timer thread object and store it in the instance."""
+        """Schedule the first run of the timer."""
         if (self._count or 1) <= 0:
-            self._logger.debug('%s not started', str(self))
+            _logger.debug('%s not started', self)
             return
         else:
+            self._start = time.monotonic()
+            self._ticks = 0
             self._create_timer()
-            self._logger.debug('%s started', str(self))
+            _logger.debug('%s started', self)
 
     def stop(self):
-        """Destroy timer thread object."""
+        """Cancel the scheduled run of the timer."""
         self._stopping = True
         if self._timer is not None:
             self._timer.cancel()
-            self._logger.debug('%s stopped', str(self))
+            _logger.debug('%s stopped', self)
+        if self._offloading is not None:
+            with self._offloading.lock:
+                self._offloading.queue.clear()
 
     def prescaler(self, factor, callback, *args, **kwargs):
         """Register a callback function called at each factor tick.
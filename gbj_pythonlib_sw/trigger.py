@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """Module for managing and executing triggers as value dependend callbacks."""
-__version__ = '0.3.0'
+__version__ = '0.4.0'
 __status__ = 'Beta'
 __author__ = 'Libor Gabaj'
 __copyright__ = 'Copyright 2018-2019, ' + __author__
@@ -16,6 +16,9 @@ import logging
 ###############################################################################
 # Variables
 ###############################################################################
+_logger = logging.getLogger(' '.join([__name__, __version__]))
+"""logging.Logger: Logger shared by all instances of the module's classes."""
+
 triggers = {}
 """dict: Registration storage of triggers."""
 
@@ -106,6 +109,11 @@ class Trigger(object):
 
     """
 
+    __slots__ = (
+        '_args', '_kwargs', '__threshold', '_callbacks', '_order', '__name',
+        '_mode', '_run', '_value',
+    )
+
     MODE = ['UPPER', 'UPPER1', 'LOWER', 'LOWER1']
     """list of str: Available trigger types."""
 
@@ -127,16 +135,11 @@ class Trigger(object):
         self._order = type(self)._instances
         self.__name = self._kwargs.pop('name',
             f'{self.__class__.__name__}{self._order}')
-        # Sanitize mode
-        self._mode = str(self._kwargs.pop('mode', self.MODE[0])).upper()
-        if self._mode not in self.MODE:
-            self._mode = self.MODE[0]
+        self.mode = self._kwargs.pop('mode', self.MODE[0])
         # Register trigger
         self._value = None
         register(self)
-        # Logging
-        self._logger = logging.getLogger(' '.join([__name__, __version__]))
-        self._logger.debug(
+        _logger.debug(
             'Instance of %s created: %s',
             self.__class__.__name__, str(self)
         )
@@ -146,8 +149,8 @@ class Trigger(object):
 
         Notes
         -----
-        - In this method the object self._logger does not already exist,
-          so that logging is not possible.
+        - In this method the module logger might not already exist at
+          interpreter shutdown, so that logging is not possible.
 
         """
         type(self)._instances -= 1
@@ -181,6 +184,31 @@ class Trigger(object):
         """Name of the trigger."""
         return self.__name
 
+    @property
+    def mode(self):
+        """Processing mode of the trigger."""
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode):
+        """Set processing mode of the trigger.
+
+        Arguments
+        ---------
+        mode : str
+            Enumerated processing mode from available trigger types.
+            If unknown one provided, the default one is set.
+
+        """
+        mode = str(mode).upper()
+        if mode not in self.MODE:
+            mode = self.MODE[0]
+        self._mode = mode
+        # Look up evaluation method once instead of per run. It is stored
+        # as a plain function, since a bound method would reference
+        # the instance from its own slot.
+        self._run = getattr(type(self), '_run_' + mode.lower())
+
     @property
     def threshold(self):
         """Trigger threshold value."""
@@ -231,13 +259,15 @@ class Trigger(object):
             runflag = func(self, value)
             self._value = value
             if runflag:
+                debug = _logger.isEnabledFor(logging.DEBUG)
                 for callback in self._callbacks:
-                    msg = \
-                        f"{self._mode} trigger's " \
-                        f'callback {callback.__name__} ' \
-                        f'for threshold {str(self.__threshold)} ' \
-                        f'at value {str(value)}'
-                    self._logger.debug(msg)
+                    if debug:
+                        _logger.debug(
+                            "%s trigger's callback %s "
+                            'for threshold %s at value %s',
+                            self._mode, callback.__name__,
+                            self.__threshold, value
+                        )
                     try:
                         callback(
                             *self._args,
@@ -246,7 +276,7 @@ class Trigger(object):
                             **self._kwargs
                         )
                     except Exception:
-                        self._logger.error(
+                        _logger.error(
                             'Running callback %s failed:',
                             callback.__name__, exc_info=True)
             return runflag
@@ -276,8 +306,7 @@ class Trigger(object):
 
     def run(self, value):
         """Process trigger with comparison value."""
-        func = eval('self._run_' + self._mode.lower())
-        return func(value)
+        return self._run(self, value)
 
 
 ###############################################################################
@@ -286,6 +315,8 @@ class Trigger(object):
 class TriggerUpper(Trigger):
     """Creating and registering an upper trigger."""
 
+    __slots__ = ()
+
     def __init__(self, threshold, callback, *args, **kwargs):
         """Create the class instance - constructor."""
         kwargs.pop('mode', None)
@@ -300,6 +331,8 @@ class TriggerUpper(Trigger):
 class TriggerUpper1(Trigger):
     """Creating and registering a one-time upper trigger."""
 
+    __slots__ = ()
+
     def __init__(self, threshold, callback, *args, **kwargs):
         """Create the class instance - constructor."""
         kwargs.pop('mode', None)
@@ -314,6 +347,8 @@ class TriggerUpper1(Trigger):
 class TriggerLower(Trigger):
     """Creating and registering a lower trigger."""
 
+    __slots__ = ()
+
     def __init__(self, threshold, callback, *args, **kwargs):
         """Create the class instance - constructor."""
         kwargs.pop('mode', None)
@@ -328,6 +363,8 @@ class TriggerLower(Trigger):
 class TriggerLower1(Trigger):
     """Creating and registering a one-time lower trigger."""
 
+    __slots__ = ()
+
     def __init__(self, threshold, callback, *args, **kwargs):
         """Create the class instance - constructor."""
         kwargs.pop('mode', None)
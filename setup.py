@@ -22,6 +22,7 @@ setup(
   license='MIT',
   packages=['gbj_pythonlib_sw'],
   install_requires=['paho-mqtt', 'psutil'],
+  extras_require={'batch': ['numpy']},
   include_package_data=True,
   zip_safe=False
 )